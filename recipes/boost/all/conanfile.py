@@ -80,6 +80,7 @@ class BoostConan(ConanFile):
         "error_code_header_only": [True, False],
         "system_no_deprecated": [True, False],
         "asio_no_deprecated": [True, False],
+        "asio_io_uring": [True, False],
         "filesystem_no_deprecated": [True, False],
         "filesystem_use_std_fs": [True, False],
         "filesystem_version": [None, "3", "4"],
@@ -119,6 +120,7 @@ class BoostConan(ConanFile):
         "error_code_header_only": False,
         "system_no_deprecated": False,
         "asio_no_deprecated": False,
+        "asio_io_uring": False,
         "filesystem_no_deprecated": False,
         "filesystem_use_std_fs": False,
         "filesystem_version": None,
@@ -410,6 +412,10 @@ class BoostConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.with_stacktrace_backtrace
 
+        # io_uring is a Linux kernel interface
+        if self.settings.os != "Linux":
+            del self.options.asio_io_uring
+
         # nowide requires a c++11-able compiler + movable std::fstream: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         # json requires a c++11-able compiler: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         if self.settings.compiler.get_safe("cppstd"):
@@ -820,6 +826,8 @@ class BoostConan(ConanFile):
             self.requires("zstd/[>=1.5 <1.6]")
         if self._with_stacktrace_backtrace:
             self.requires("libbacktrace/cci.20210118", transitive_headers=True, transitive_libs=True)
+        if self.options.get_safe("asio_io_uring"):
+            self.requires("liburing/2.11", transitive_headers=True, transitive_libs=True)
 
         if self._with_icu:
             self.requires("icu/74.2")
@@ -1374,6 +1382,10 @@ class BoostConan(ConanFile):
             flags.append("define=BOOST_SYSTEM_NO_DEPRECATED=1")
         if self.options.asio_no_deprecated:
             flags.append("define=BOOST_ASIO_NO_DEPRECATED=1")
+        if self.options.get_safe("asio_io_uring"):
+            # compiled libraries using Asio (process, cobalt, ...) must agree with consumers on the backend
+            flags.append("define=BOOST_ASIO_HAS_IO_URING=1")
+            flags.append("define=BOOST_ASIO_DISABLE_EPOLL=1")
         if self.options.filesystem_no_deprecated:
             flags.append("define=BOOST_FILESYSTEM_NO_DEPRECATED=1")
         if self.options.filesystem_use_std_fs:
@@ -1591,6 +1603,12 @@ class BoostConan(ConanFile):
             cppflags += " ".join(f"-I{p}" for p in backtrace_aggregated_cpp_info.includedirs) + " "
             ldflags += " ".join(f"-L{p}" for p in backtrace_aggregated_cpp_info.libdirs) + " "
 
+        if self.options.get_safe("asio_io_uring"):
+            liburing_aggregated_cpp_info = self.dependencies["liburing"].cpp_info.aggregated_components()
+            cppflags += " ".join(f"-I{p}" for p in liburing_aggregated_cpp_info.includedirs) + " "
+            ldflags += " ".join(f"-L{p}" for p in liburing_aggregated_cpp_info.libdirs) + " "
+            ldflags += " ".join(f"-l{lib}" for lib in liburing_aggregated_cpp_info.libs) + " "
+
         if cxxflags.strip():
             contents += f'<cxxflags>"{cxxflags.strip()}" '
         if cflags.strip():
@@ -1766,6 +1784,11 @@ class BoostConan(ConanFile):
         if self.options.asio_no_deprecated:
             self.cpp_info.components["headers"].defines.append("BOOST_ASIO_NO_DEPRECATED")
 
+        if self.options.get_safe("asio_io_uring"):
+            # io_uring for file and socket operations alike, epoll would otherwise keep handling sockets
+            self.cpp_info.components["headers"].defines.extend(["BOOST_ASIO_HAS_IO_URING", "BOOST_ASIO_DISABLE_EPOLL"])
+            self.cpp_info.components["headers"].requires.append("liburing::liburing")
+
         if self.options.filesystem_no_deprecated:
             self.cpp_info.components["headers"].defines.append("BOOST_FILESYSTEM_NO_DEPRECATED")
 
@@ -0,0 +1,54 @@
+#include <boost/asio/io_context.hpp>
+#include <boost/asio/random_access_file.hpp>
+#include <boost/asio/read_at.hpp>
+#include <boost/asio/buffer.hpp>
+#include <boost/system/system_error.hpp>
+
+#include <cstdio>
+#include <fstream>
+#include <iostream>
+#include <string>
+
+#if defined(BOOST_NAMESPACE)
+namespace boost = BOOST_NAMESPACE;
+#endif
+
+#if !defined(BOOST_ASIO_HAS_IO_URING) || !defined(BOOST_ASIO_HAS_FILE)
+#error "boost was built with asio_io_uring, but Asio doesn't see the io_uring file support"
+#endif
+
+int main()
+{
+    const std::string path = "asio_io_uring_test.txt";
+    const std::string contents = "Boost.Asio read this file through io_uring";
+    {
+        std::ofstream out(path.c_str(), std::ios::binary);
+        out << contents;
+    }
+
+    try {
+        boost::asio::io_context io;
+        boost::asio::random_access_file file(io, path, boost::asio::random_access_file::read_only);
+
+        std::string buffer(contents.size(), '\0');
+        std::size_t bytes_read = 0;
+        boost::asio::async_read_at(file, 0, boost::asio::buffer(&buffer[0], buffer.size()),
+            [&bytes_read](const boost::system::error_code& ec, std::size_t n) {
+                if (!ec)
+                    bytes_read = n;
+            });
+        io.run();
+        std::remove(path.c_str());
+
+        if (bytes_read != contents.size() || buffer != contents) {
+            std::cerr << "io_uring read returned unexpected data: " << buffer << std::endl;
+            return 1;
+        }
+        std::cout << "read " << bytes_read << " bytes through io_uring: " << buffer << std::endl;
+    } catch (const boost::system::system_error& e) {
+        std::remove(path.c_str());
+        // The ring can't be created when the kernel is too old or io_uring is blocked (e.g. by seccomp in containers)
+        std::cout << "io_uring not available from the kernel, skipping: " << e.what() << std::endl;
+    }
+    return 0;
+}
@@ -1,3 +1,4 @@
+import glob
 import os
 import re
 import textwrap
@@ -5,6 +6,7 @@ import textwrap
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os, fix_apple_shared_install_name
+from conan.tools.build import cross_building
 from conan.tools.env import VirtualRunEnv
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, mkdir, replace_in_file, rm, rmdir, save, unzip
 from conan.tools.gnu import Autotools, AutotoolsToolchain, AutotoolsDeps, PkgConfigDeps
@@ -30,6 +32,10 @@ class CPythonConan(ConanFile):
         "fPIC": [True, False],
         "optimizations": [True, False],
         "lto": [True, False],
+        "bolt": [True, False],
+        "freethreading": [True, False],
+        "experimental_jit": ["no", "yes", "yes-off", "interpreter"],
+        "with_mimalloc": [True, False],
         "docstrings": [True, False],
         "pymalloc": [True, False],
         "with_bz2": [True, False],
@@ -48,6 +54,10 @@ class CPythonConan(ConanFile):
         "fPIC": True,
         "optimizations": False,
         "lto": False,
+        "bolt": False,
+        "freethreading": False,
+        "experimental_jit": "no",
+        "with_mimalloc": True,
         "docstrings": True,
         "pymalloc": True,
         "with_bz2": True,
@@ -86,6 +96,17 @@ class CPythonConan(ConanFile):
             del self.options.with_curses
             del self.options.with_gdbm
             del self.options.with_nis
+        if Version(self.version) < "3.12" or self.settings.os != "Linux" or is_msvc(self):
+            # --enable-bolt was added in 3.12, llvm-bolt only handles ELF binaries
+            del self.options.bolt
+        if Version(self.version) < "3.13" or is_msvc(self):
+            # --disable-gil, --enable-experimental-jit and --with-mimalloc were added in 3.13
+            del self.options.freethreading
+            del self.options.experimental_jit
+            del self.options.with_mimalloc
+        if Version(self.version) >= "3.13":
+            # nis was removed in 3.13 (PEP 594)
+            self.options.rm_safe("with_nis")
 
         self.settings.compiler.rm_safe("libcxx")
         self.settings.compiler.rm_safe("cppstd")
@@ -170,6 +191,9 @@ class CPythonConan(ConanFile):
                 )
             if str(self.settings.arch) not in self._msvc_archs:
                 raise ConanInvalidConfiguration("Visual Studio does not support this architecture")
+            if Version(self.version) >= "3.13":
+                # FIXME: port the PCbuild patches (_ctypes-ffi, remove-module-deps) to 3.13
+                raise ConanInvalidConfiguration("cpython >= 3.13 is not yet supported with msvc")
             if not self.options.shared and Version(self.version) >= "3.10":
                 # Static CPython on Windows is only loosely supported, see https://github.com/python/cpython/issues/110234
                 # 3.10 fails during the test, 3.11 fails during the build (missing symbol that seems to be DLL specific: PyWin_DLLhModule)
@@ -183,6 +207,22 @@ class CPythonConan(ConanFile):
                 if self.dependencies["mpdecimal"].ref.version < Version("2.5.0"):
                     raise ConanInvalidConfiguration("cpython 3.9.0 (and newer) requires (at least) mpdecimal 2.5.0")
 
+        if self.options.get_safe("bolt"):
+            if str(self.settings.arch) not in ["x86_64", "armv8"]:
+                raise ConanInvalidConfiguration("bolt=True is only supported on x86_64 and armv8")
+            if cross_building(self):
+                raise ConanInvalidConfiguration("bolt=True needs to run the interpreter to collect a profile, it can't be cross-built")
+
+        if self.options.get_safe("freethreading"):
+            if not self.options.with_mimalloc:
+                raise ConanInvalidConfiguration("freethreading=True requires with_mimalloc=True")
+            if self.options.experimental_jit != "no":
+                raise ConanInvalidConfiguration("experimental_jit is not supported together with freethreading=True")
+
+        if self.options.get_safe("experimental_jit", "no") != "no":
+            if str(self.settings.arch) not in ["x86_64", "armv8"]:
+                raise ConanInvalidConfiguration("experimental_jit is only supported on x86_64 and armv8")
+
         if self.settings.compiler == "gcc" and Version(self.settings.compiler.version).major == 9 and Version(self.version) >= "3.12":
             raise ConanInvalidConfiguration("FIXME: GCC 9 produces an internal compiler error locally, and a link error in CCI")
 
@@ -228,10 +268,29 @@ class CPythonConan(ConanFile):
                 "--with-tcltk-includes={}".format(" ".join(tcltk_includes)),
                 "--with-tcltk-libs={}".format(" ".join(tcltk_libs)),
             ]
+        if self.options.get_safe("bolt"):
+            tc.configure_args.append("--enable-bolt")
+        if self.options.get_safe("freethreading"):
+            tc.configure_args.append("--disable-gil")
+        if self.options.get_safe("experimental_jit", "no") != "no":
+            tc.configure_args.append(f"--enable-experimental-jit={self.options.experimental_jit}")
+        if self.options.get_safe("with_mimalloc") is not None:
+            tc.configure_args.append("--with-mimalloc={}".format(yes_no(self.options.with_mimalloc)))
         if not is_apple_os(self):
             tc.extra_ldflags.append('-Wl,--as-needed')
 
-        tc.generate()
+        env = tc.environment()
+        llvm_bolt = self.conf.get("user.cpython:llvm_bolt", check_type=str)
+        if self.options.get_safe("bolt") and llvm_bolt:
+            # Otherwise configure looks up llvm-bolt and merge-fdata in PATH
+            env.define_path("LLVM_BOLT", llvm_bolt)
+            env.define_path("MERGE_FDATA", os.path.join(os.path.dirname(llvm_bolt), "merge-fdata"))
+        llvm_bindir = self.conf.get("user.cpython:llvm_bindir", check_type=str)
+        if self.options.get_safe("experimental_jit", "no") != "no" and llvm_bindir:
+            # The JIT stencils are compiled with clang, Tools/jit looks up clang, llvm-objdump and llvm-readobj
+            # of the LLVM version it requires (18 for 3.13) in PATH
+            env.prepend_path("PATH", llvm_bindir)
+        tc.generate(env)
 
         deps = AutotoolsDeps(self)
         deps.generate()
@@ -534,6 +593,42 @@ class CPythonConan(ConanFile):
         cmd = msbuild.command(sln, targets=projects)
         self.run(f"{cmd} /p:PlatformToolset={msvs_toolset(self)}")
 
+    @property
+    def _pgo_profile_dir(self):
+        return self.conf.get("user.cpython:pgo_profile_dir", check_type=str)
+
+    @property
+    def _pgo_profile_patterns(self):
+        # gcc writes the profile next to each object file, clang merges it into a single file
+        return ["code.profclangd"] if "clang" in str(self.settings.compiler) else ["*.gcda"]
+
+    def _pgo_profile_files(self, folder):
+        files = []
+        for pattern in self._pgo_profile_patterns:
+            files.extend(glob.glob(os.path.join(folder, "**", pattern), recursive=True))
+        return files
+
+    def _pgo_restore_profile(self):
+        profile_dir = self._pgo_profile_dir
+        if not profile_dir or not os.path.isdir(profile_dir):
+            return
+        copied = []
+        for pattern in self._pgo_profile_patterns:
+            copied.extend(copy(self, pattern, src=profile_dir, dst=self.build_folder))
+        if not copied:
+            self.output.info(f"No PGO profile found in {profile_dir}, running the training workload")
+            return
+        # The profile-opt target skips the instrumented build and the training run when this stamp exists
+        save(self, os.path.join(self.build_folder, "profile-run-stamp"), "")
+        self.output.info(f"Reusing PGO profile from {profile_dir}")
+
+    def _pgo_store_profile(self):
+        profile_dir = self._pgo_profile_dir
+        if not profile_dir or self._pgo_profile_files(profile_dir):
+            return
+        for pattern in self._pgo_profile_patterns:
+            copy(self, pattern, src=self.build_folder, dst=profile_dir)
+
     def build(self):
         self._patch_sources()
         if is_msvc(self):
@@ -541,7 +636,15 @@ class CPythonConan(ConanFile):
         else:
             autotools = Autotools(self)
             autotools.configure()
-            autotools.make()
+            make_args = []
+            if self.options.optimizations:
+                self._pgo_restore_profile()
+                profile_task = self.conf.get("user.cpython:pgo_profile_task", check_type=str)
+                if profile_task:
+                    make_args.append(f"PROFILE_TASK='{profile_task}'")
+            autotools.make(args=make_args)
+            if self.options.optimizations:
+                self._pgo_store_profile()
 
     @property
     def _msvc_artifacts_path(self):
@@ -679,6 +782,7 @@ class CPythonConan(ConanFile):
         endif()
         set(Python${_CONAN_PYTHON_SUFFIX}_EXECUTABLE @PYTHON_EXECUTABLE@)
         set(Python${_CONAN_PYTHON_SUFFIX}_LIBRARY @PYTHON_LIBRARY@)
+        @PYTHON_FIND_ABI@
 
         # Fails if these are set beforehand
         unset(Python${_CONAN_PYTHON_SUFFIX}_INCLUDE_DIRS)
@@ -711,7 +815,15 @@ class CPythonConan(ConanFile):
             python_library = "${CMAKE_CURRENT_LIST_DIR}/../" + self._exact_lib_name
 
         cmake_file = os.path.join(self.package_folder, self._cmake_module_path, "use_conan_python.cmake")
+        if self.options.get_safe("freethreading"):
+            # The 4th element of the ABI tuple selects the free-threaded (t) ABI, honored by CMake >= 3.30
+            debug_abi = "ON" if self.settings.build_type == "Debug" else "OFF"
+            python_find_abi = f'set(Python${{_CONAN_PYTHON_SUFFIX}}_FIND_ABI "{debug_abi};ANY;ANY;ON")'
+        else:
+            python_find_abi = ""
+
         content = template.replace("@PYTHON_EXECUTABLE@", python_exe).replace("@PYTHON_LIBRARY@", python_library)
+        content = content.replace("@PYTHON_FIND_ABI@", python_find_abi)
         save(self, cmake_file, content)
 
     def package(self):
@@ -752,13 +864,13 @@ class CPythonConan(ConanFile):
                         while [ -L "$__file__" ]; do
                             __file__="$(dirname "$__file__")/$(readlink "$__file__")"
                         done
-                        exec "$(dirname "$__file__")/python{self._version_suffix}" "$0" "$@"
+                        exec "$(dirname "$__file__")/{self._cpython_interpreter_name}" "$0" "$@"
                         '''
                         """).encode())
                     fn.write(text)
 
             if not os.path.exists(self._cpython_symlink):
-                os.symlink(f"python{self._version_suffix}", self._cpython_symlink)
+                os.symlink(self._cpython_interpreter_name, self._cpython_symlink)
         fix_apple_shared_install_name(self)
 
         self._write_cmake_findpython_wrapper_file()
@@ -778,6 +890,8 @@ class CPythonConan(ConanFile):
                 python += "_d"
         else:
             python += self._version_suffix
+            if self.options.get_safe("freethreading"):
+                python += "t"
         if self.settings.os == "Windows":
             python += ".exe"
         return python
@@ -789,6 +903,8 @@ class CPythonConan(ConanFile):
     @property
     def _abi_suffix(self):
         res = ""
+        if self.options.get_safe("freethreading"):
+            res += "t"
         if self.settings.build_type == "Debug":
             res += "d"
         return res
@@ -806,6 +922,8 @@ class CPythonConan(ConanFile):
 
     def package_info(self):
         py_version = Version(self.version)
+        # Free-threaded builds install their pkg-config files with the abi flag, e.g. python-3.13t.pc
+        pc_abi = "t" if self.options.get_safe("freethreading") else ""
         # python component: "Build a C extension for Python"
         if is_msvc(self):
             self.cpp_info.components["python"].includedirs = [os.path.join(self._msvc_install_subprefix, "include")]
@@ -829,7 +947,7 @@ class CPythonConan(ConanFile):
         if self.settings.os != "Windows":
             self.cpp_info.components["python"].requires.append("libxcrypt::libxcrypt")
         self.cpp_info.components["python"].set_property(
-            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}"
+            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}{pc_abi}"
         )
         self.cpp_info.components["python"].set_property(
             "pkg_config_aliases", [f"python{py_version.major}"]
@@ -841,7 +959,7 @@ class CPythonConan(ConanFile):
         self.cpp_info.components["embed"].libdirs = [libdir]
         self.cpp_info.components["embed"].includedirs = []
         self.cpp_info.components["embed"].set_property(
-            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}-embed"
+            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}{pc_abi}-embed"
         )
         self.cpp_info.components["embed"].set_property(
             "pkg_config_aliases", [f"python{py_version.major}-embed"]
@@ -139,6 +139,22 @@ class TestPackageConan(ConanFile):
                     f"python reported wrong version. Expected {self._py_version}. Got {version_detected}."
                 )
 
+            jit_expected = self._cpython_option("experimental_jit")
+            if jit_expected and jit_expected != "no":
+                buffer = StringIO()
+                self.run(f"{self._python} \"{self.source_folder}/test_package.py\" -b \"{self.build_folder}\" -t jit", buffer, env="conanrun")
+                self.output.info(buffer.getvalue())
+                jit_detected = next(line for line in buffer.getvalue().splitlines() if line.startswith("experimental_jit="))
+                if jit_detected != f"experimental_jit={jit_expected}":
+                    raise ConanException(f"python reported wrong JIT mode. Expected {jit_expected}. Got {jit_detected}.")
+
+            if self._cpython_option("freethreading"):
+                self._test_module("freethreading", True)
+
+            if (jit_expected and jit_expected != "no") or any(self._cpython_option(option) for option in ("freethreading", "optimizations", "bolt")):
+                # Timings to compare the non-default performance builds against a default build of the same version
+                self._test_module("bench", True)
+
             if self._supports_modules:
                 self._test_module("gdbm", self._cpython_option("with_gdbm"))
                 self._test_module("bz2", self._cpython_option("with_bz2"))
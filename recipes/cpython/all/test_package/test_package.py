@@ -189,6 +189,123 @@ def test_ssl():
     print("default_context.options={}".format(default_context.options))
 
 
+@add_test
+def test_jit():
+    import sysconfig
+
+    # The configure flag is recorded in CONFIG_ARGS (not available on Windows), e.g. --enable-experimental-jit=yes-off
+    mode = "no"
+    for arg in (sysconfig.get_config_var("CONFIG_ARGS") or "").split():
+        arg = arg.strip("'\"")
+        if arg == "--enable-experimental-jit":
+            mode = "yes"
+        elif arg.startswith("--enable-experimental-jit="):
+            mode = arg.split("=", 1)[1]
+    print("experimental_jit={}".format(mode))
+    # sys._jit was added in 3.14
+    jit = getattr(sys, "_jit", None)
+    if jit is not None:
+        print("jit available={} enabled={}".format(jit.is_available(), jit.is_enabled()))
+
+
+@add_test
+def test_freethreading():
+    # The free-threaded build is tagged with the "t" ABI flag and runs without the GIL unless a module re-enables it
+    print("abiflags={} gil_enabled={}".format(sys.abiflags, sys._is_gil_enabled()))
+    assert "t" in sys.abiflags
+    assert sys._is_gil_enabled() is False
+
+
+def _bench_nbody(steps):
+    bodies = [
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 39.47841760435743],
+        [4.84, -1.16, -0.10, 0.606, 2.81, -0.02, 0.037],
+        [8.34, 4.12, -0.40, -1.01, 1.82, 0.008, 0.011],
+        [12.89, -15.11, -0.22, 1.08, 0.868, -0.01, 0.0017],
+        [15.37, -25.91, 0.17, 0.979, 0.594, -0.034, 0.002],
+    ]
+    pairs = [(bodies[i], bodies[j]) for i in range(len(bodies)) for j in range(i + 1, len(bodies))]
+    dt = 0.01
+    for _ in range(steps):
+        for b1, b2 in pairs:
+            dx, dy, dz = b1[0] - b2[0], b1[1] - b2[1], b1[2] - b2[2]
+            mag = dt * ((dx * dx + dy * dy + dz * dz) ** -1.5)
+            b1m, b2m = b1[6] * mag, b2[6] * mag
+            b1[3] -= dx * b2m
+            b1[4] -= dy * b2m
+            b1[5] -= dz * b2m
+            b2[3] += dx * b1m
+            b2[4] += dy * b1m
+            b2[5] += dz * b1m
+        for b in bodies:
+            b[0] += dt * b[3]
+            b[1] += dt * b[4]
+            b[2] += dt * b[5]
+
+
+def _bench_fannkuch(n):
+    perm = list(range(n))
+    count = [0] * n
+    max_flips = 0
+    r = n
+    while True:
+        while r != 1:
+            count[r - 1] = r
+            r -= 1
+        p = perm[:]
+        flips = 0
+        k = p[0]
+        while k:
+            p[: k + 1] = p[k::-1]
+            flips += 1
+            k = p[0]
+        max_flips = max(max_flips, flips)
+        while r != n:
+            perm.insert(r, perm.pop(0))
+            count[r] -= 1
+            if count[r] > 0:
+                break
+            r += 1
+        else:
+            return max_flips
+
+
+def _bench_generators(n):
+    def tree(depth):
+        if depth == 0:
+            yield 1
+            return
+        yield from tree(depth - 1)
+        yield from tree(depth - 1)
+
+    return sum(sum(tree(10)) for _ in range(n))
+
+
+def _bench_dict_str(n):
+    counts = {}
+    for i in range(n):
+        key = "key{}".format(i % 1000)
+        counts[key] = counts.get(key, 0) + len(key)
+    return len(counts)
+
+
+@add_test
+def test_bench():
+    import time
+
+    # Small pyperformance-like workloads, meant to compare builds (optimizations, lto, jit, mimalloc...) of the same version
+    workloads = [
+        ("nbody", lambda: _bench_nbody(20000)),
+        ("fannkuch", lambda: _bench_fannkuch(8)),
+        ("generators", lambda: _bench_generators(50)),
+        ("dict_str", lambda: _bench_dict_str(200000)),
+    ]
+    for name, workload in workloads:
+        start = time.perf_counter()
+        workload()
+        print("{:<12} {:8.1f} ms".format(name, (time.perf_counter() - start) * 1000))
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-b", dest="build_folder", help="build_folder", required=True)
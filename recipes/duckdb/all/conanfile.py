@@ -31,6 +31,8 @@ class DuckdbConan(ConanFile):
         "with_visualizer": [True, False],
         "with_httpfs": [True, False],
         "with_json": [True, False],
+        "with_parquet": [True, False],
+        "with_jemalloc": [True, False],
         "with_excel": [True, False],
         "with_inet": [True, False],
         "with_sqlsmith": [True, False],
@@ -51,6 +53,8 @@ class DuckdbConan(ConanFile):
         "with_visualizer": False,
         "with_httpfs": False,
         "with_json": False,
+        "with_parquet": True,
+        "with_jemalloc": True,
         "with_excel": False,
         "with_inet": False,
         "with_sqlsmith": False,
@@ -74,6 +78,9 @@ class DuckdbConan(ConanFile):
             del self.options.fPIC
         if Version(self.version) >= "1.1.0":
             del self.options.with_odbc
+        # jemalloc extension is only available on Linux (x86_64 since 0.10.1)
+        if self.settings.os != "Linux" or (Version(self.version) >= "0.10.1" and self.settings.arch != "x86_64"):
+            del self.options.with_jemalloc
 
     def configure(self):
         if self.options.shared:
@@ -133,6 +140,14 @@ class DuckdbConan(ConanFile):
             build_extensions += ";sqlsmith"
         tc.variables["BUILD_EXTENSIONS"] = build_extensions
 
+        # parquet and jemalloc are built in by default, they can only be opted out
+        skip_extensions = ""
+        if not self.options.with_parquet:
+            skip_extensions += ";parquet"
+        if not self.options.get_safe("with_jemalloc"):
+            skip_extensions += ";jemalloc"
+        tc.variables["SKIP_EXTENSIONS"] = skip_extensions
+
         if "with_odbc" in self.options:
             tc.variables["BUILD_ODBC_DRIVER"] = self.options.with_odbc
         tc.variables["FORCE_QUERY_LOG"] = self.options.with_query_log
@@ -207,7 +222,7 @@ class DuckdbConan(ConanFile):
                 self.cpp_info.libs.append("autocomplete_extension")
             if self.options.with_icu:
                 self.cpp_info.libs.append("icu_extension")
-            if self.options.get_safe("with_parquet", True):
+            if self.options.with_parquet:
                 self.cpp_info.libs.append("parquet_extension")
             if self.options.with_tpch:
                 self.cpp_info.libs.append("tpch_extension")
@@ -219,8 +234,7 @@ class DuckdbConan(ConanFile):
                 self.cpp_info.libs.append("visualizer_extension")
             if self.options.with_httpfs:
                 self.cpp_info.libs.append("httpfs_extension")
-            if (self.settings.os == "Linux" and
-                (Version(self.version) < "0.10.1" or self.settings.arch == "x86_64")):
+            if self.options.get_safe("with_jemalloc"):
                 self.cpp_info.libs.append("jemalloc_extension")
             if self.options.with_json:
                 self.cpp_info.libs.append("json_extension")
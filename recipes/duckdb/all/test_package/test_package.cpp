@@ -1,7 +1,34 @@
+#include <cstdio>
 #include <iostream>
 #include "duckdb.hpp"
 
 int main() {
     duckdb::DuckDB db(nullptr);
 	duckdb::Connection con(db);
+
+#ifdef TEST_PARQUET
+    auto written = con.Query("COPY (SELECT range AS i, range % 7 AS k FROM range(100000)) TO 'test_package.parquet' (FORMAT PARQUET)");
+    if (written->HasError()) {
+        std::cerr << written->GetError() << std::endl;
+        return 1;
+    }
+    auto scanned = con.Query("SELECT sum(i), count(DISTINCT k) FROM 'test_package.parquet'");
+    if (scanned->HasError()) {
+        std::cerr << scanned->GetError() << std::endl;
+        return 1;
+    }
+    std::remove("test_package.parquet");
+    std::cout << "Parquet scan: " << scanned->GetValue(0, 0).ToString() << ", " << scanned->GetValue(1, 0).ToString() << std::endl;
+    if (scanned->GetValue(0, 0).ToString() != "4999950000") {
+        return 1;
+    }
+#endif
+
+    auto extensions = con.Query("SELECT extension_name FROM duckdb_extensions() WHERE loaded ORDER BY extension_name");
+    if (!extensions->HasError()) {
+        for (duckdb::idx_t row = 0; row < extensions->RowCount(); row++) {
+            std::cout << "Loaded extension: " << extensions->GetValue(0, row).ToString() << std::endl;
+        }
+    }
+    return 0;
 }
@@ -1,5 +1,6 @@
 from conan import ConanFile
 from conan.tools.build import check_min_cppstd
+from conan.tools.microsoft import is_msvc
 from conan.tools.cmake import CMake, cmake_layout, CMakeToolchain
 from conan.tools.files import apply_conandata_patches, export_conandata_patches, copy, get, rmdir
 from conan.tools.scm import Version
@@ -21,9 +22,17 @@ class EigenConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "MPL2_only": [True, False],
+        "blas_backend": ["none", "openblas"],
+        "openmp": [True, False],
     }
     default_options = {
         "MPL2_only": False,
+        "blas_backend": "none",
+        "openmp": False,
+    }
+    options_description = {
+        "blas_backend": "Make consumers offload dense products and decompositions to an external BLAS/LAPACKE (EIGEN_USE_BLAS, EIGEN_USE_LAPACKE)",
+        "openmp": "Make consumers compile and link with OpenMP, which parallelizes Eigen own matrix products",
     }
 
     def export_sources(self):
@@ -40,6 +49,13 @@ class EigenConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def requirements(self):
+        # Eigen is header-only, the BLAS and OpenMP requirements are only used by the consumers
+        if self.options.blas_backend == "openblas":
+            self.requires("openblas/0.3.30")
+        if self.options.openmp and self.settings.compiler in ("clang", "apple-clang"):
+            self.requires("llvm-openmp/20.1.6")
+
     def package_id(self):
         self.info.clear()
 
@@ -89,6 +105,22 @@ class EigenConan(ConanFile):
             self.cpp_info.components["eigen3"].system_libs = ["m"]
         if self.options.get_safe("MPL2_only"):
             self.cpp_info.components["eigen3"].defines = ["EIGEN_MPL2_ONLY"]
+        if self.options.blas_backend == "openblas":
+            self.cpp_info.components["eigen3"].requires.append("openblas::openblas")
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_BLAS")
+            # Eigen declares the LAPACKE prototypes itself, the symbols are only there if OpenBLAS built LAPACK
+            if self.dependencies["openblas"].options.build_lapack:
+                self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_LAPACKE")
+        if self.options.openmp:
+            # this is a header only library, so downstream consumers need to enable the openmp flag
+            if self.settings.compiler in ("clang", "apple-clang"):
+                self.cpp_info.components["eigen3"].requires.append("llvm-openmp::llvm-openmp")
+            elif is_msvc(self):
+                self.cpp_info.components["eigen3"].cxxflags.append("/openmp")
+            else:
+                self.cpp_info.components["eigen3"].cxxflags.append("-fopenmp")
+                self.cpp_info.components["eigen3"].sharedlinkflags.append("-fopenmp")
+                self.cpp_info.components["eigen3"].exelinkflags.append("-fopenmp")
 
         self.cpp_info.components["eigen3"].set_property("cmake_target_name", "Eigen3::Eigen")
         self.cpp_info.components["eigen3"].includedirs = [os.path.join("include", "eigen3")]
@@ -1,5 +1,7 @@
 #include <iostream>
+#include <limits>
 #include <Eigen/Core>
+#include <Eigen/Dense>
 #include <unsupported/Eigen/MatrixFunctions>
 
 
@@ -12,5 +14,26 @@ int main(void)
     std::cout << "A =\n" << A << "\n\n"
               << "A(2..3,:) =\n" << A.middleRows(2, 2) << "\n";
 
-    return 0;
+#ifdef EIGEN_USE_BLAS
+    std::cout << "\nDense products are computed by the external BLAS\n";
+#endif
+#ifdef EIGEN_USE_LAPACKE
+    std::cout << "Decompositions are computed by the external LAPACKE\n";
+#endif
+#ifdef EIGEN_HAS_OPENMP
+    std::cout << "Eigen uses " << Eigen::nbThreads() << " OpenMP threads\n";
+#endif
+
+    // Goes through the BLAS gemm and the LAPACKE getrf when they are enabled
+    int const M = 256;
+    Eigen::MatrixXd B = Eigen::MatrixXd::Random(M, M) + M * Eigen::MatrixXd::Identity(M, M);
+    Eigen::MatrixXd C = B * B.transpose();
+    Eigen::PartialPivLU<Eigen::MatrixXd> lu(C);
+    Eigen::VectorXd x = lu.solve(Eigen::VectorXd::Ones(M));
+    // Relative residual of a backward stable solve, it grows with the size and the unit roundoff
+    double const residual = (C * x - Eigen::VectorXd::Ones(M)).norm() / (C.norm() * x.norm());
+    double const tolerance = M * std::numeric_limits<double>::epsilon();
+    std::cout << "LU solve relative residual: " << residual << " (tolerance " << tolerance << ")\n";
+
+    return residual < tolerance ? 0 : 1;
 }
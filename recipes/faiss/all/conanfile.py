@@ -2,6 +2,7 @@ import os
 
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
+from conan.tools.apple import is_apple_os
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import copy, get, rm, rmdir, replace_in_file
@@ -21,19 +22,38 @@ class FaissConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "opt_level": ["generic", "avx2", "avx512", "avx512_spr", "sve"],
+        "blas": ["openblas", "accelerate"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "opt_level": "generic",
+        "blas": "openblas",
     }
 
     implements = ["auto_shared_fpic"]
 
+    @property
+    def _opt_level_lib(self):
+        # FAISS_OPT_LEVEL builds the generic library plus one complete library per enabled SIMD level,
+        # the one of the requested level is what the faiss target links
+        return {
+            "generic": "faiss",
+            "avx2": "faiss_avx2",
+            "avx512": "faiss_avx512",
+            "avx512_spr": "faiss_avx512_spr",
+            "sve": "faiss_sve",
+        }[str(self.options.opt_level)]
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        self.requires("openblas/0.3.27")
+        if self.options.blas == "openblas":
+            self.requires("openblas/0.3.30")
+        if self.settings.compiler in ("clang", "apple-clang"):
+            self.requires("llvm-openmp/20.1.6")
         self.requires("gflags/2.2.2")
 
     def build_requirements(self):
@@ -42,9 +62,14 @@ class FaissConan(ConanFile):
     def validate(self):
         check_min_cppstd(self, 17)
 
-        if self.settings.compiler == "apple-clang":
-            raise ConanInvalidConfiguration("OpenMP support is required, which is not "
-                                            "available in Apple Clang")
+        if self.options.opt_level in ("avx2", "avx512", "avx512_spr") and self.settings.arch != "x86_64":
+            raise ConanInvalidConfiguration(f"opt_level={self.options.opt_level} requires arch=x86_64")
+        if self.options.opt_level == "sve" and self.settings.arch != "armv8":
+            raise ConanInvalidConfiguration("opt_level=sve requires arch=armv8")
+        if self.options.blas == "accelerate" and not is_apple_os(self):
+            raise ConanInvalidConfiguration("blas=accelerate is only available on Apple platforms")
+        if self.options.blas == "openblas" and not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration(f"{self.ref} requires LAPACK support in OpenBLAS with -o='openblas/*:build_lapack=True'")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -56,6 +81,8 @@ class FaissConan(ConanFile):
         tc.cache_variables["FAISS_ENABLE_GPU"] = False
         tc.cache_variables["BUILD_TESTING"] = False
         tc.cache_variables["FAISS_ENABLE_PYTHON"] = False
+        tc.cache_variables["FAISS_OPT_LEVEL"] = str(self.options.opt_level)
+        tc.cache_variables["BLA_VENDOR"] = "OpenBLAS" if self.options.blas == "openblas" else "Apple"
         tc.cache_variables["CMAKE_TRY_COMPILE_CONFIGURATION"] = str(self.settings.build_type)
 
         tc.generate()
@@ -79,14 +106,22 @@ class FaissConan(ConanFile):
         rm(self, "*.pdb", self.package_folder, recursive=True)
 
     def package_info(self):
-        self.cpp_info.libs = ["faiss"]
+        self.cpp_info.libs = [self._opt_level_lib]
 
         self.cpp_info.set_property("cmake_file_name", "faiss")
         self.cpp_info.set_property("cmake_target_name", "faiss")
 
+        self.cpp_info.requires = ["gflags::gflags"]
+        if self.options.blas == "openblas":
+            self.cpp_info.requires.append("openblas::openblas")
+        else:
+            self.cpp_info.frameworks = ["Accelerate"]
+
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs = ["m", "dl"]
 
-        if not self.options.shared and self.settings.compiler in ("clang", "gcc"):
+        if self.settings.compiler in ("clang", "apple-clang"):
+            self.cpp_info.requires.append("llvm-openmp::llvm-openmp")
+        elif not self.options.shared and self.settings.compiler == "gcc":
             self.cpp_info.exelinkflags.append("-fopenmp")
             self.cpp_info.sharedlinkflags.append("-fopenmp")
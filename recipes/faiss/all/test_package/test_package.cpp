@@ -7,5 +7,6 @@
 int main(void) {
 
     std::cout << "FAISS VERSION: " << faiss::get_version() << std::endl;
+    std::cout << "FAISS COMPILE OPTIONS: " << faiss::get_compile_options() << std::endl;
     return EXIT_SUCCESS;
 }
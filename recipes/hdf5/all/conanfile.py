@@ -32,6 +32,8 @@ class Hdf5Conan(ConanFile):
         "szip_support": [None, "with_libaec", "with_szip"],
         "szip_encoding": [True, False],
         "parallel": [True, False],
+        "enable_direct_vfd": [True, False],
+        "enable_subfiling_vfd": [True, False],
         "enable_unsupported": [True, False],
     }
     default_options = {
@@ -45,8 +47,14 @@ class Hdf5Conan(ConanFile):
         "szip_support": None,
         "szip_encoding": False,
         "parallel": False,
+        "enable_direct_vfd": False,
+        "enable_subfiling_vfd": False,
         "enable_unsupported": False
     }
+    options_description = {
+        "enable_direct_vfd": "Build the direct I/O virtual file driver (H5Pset_fapl_direct), which bypasses the page cache with O_DIRECT",
+        "enable_subfiling_vfd": "Build the subfiling virtual file driver (H5Pset_fapl_subfiling), which stripes a parallel file over several subfiles",
+    }
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -54,6 +62,8 @@ class Hdf5Conan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os != "Linux":
+            del self.options.enable_direct_vfd
 
     def configure(self):
         if self.options.shared:
@@ -66,6 +76,8 @@ class Hdf5Conan(ConanFile):
             del self.options.threadsafe
         if not bool(self.options.szip_support):
             del self.options.szip_encoding
+        if not self.options.parallel:
+            del self.options.enable_subfiling_vfd
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -143,6 +155,8 @@ class Hdf5Conan(ConanFile):
         if self.settings.build_type == "Debug":
             tc.variables["HDF5_ENABLE_INSTRUMENT"] = False  # Option?
         tc.variables["HDF5_ENABLE_PARALLEL"] = self.options.parallel
+        tc.variables["HDF5_ENABLE_DIRECT_VFD"] = self.options.get_safe("enable_direct_vfd", False)
+        tc.variables["HDF5_ENABLE_SUBFILING_VFD"] = self.options.get_safe("enable_subfiling_vfd", False)
         tc.variables["HDF5_ENABLE_Z_LIB_SUPPORT"] = self.options.with_zlib
         tc.variables["HDF5_ENABLE_SZIP_SUPPORT"] = bool(self.options.szip_support)
         tc.variables["HDF5_ENABLE_SZIP_ENCODING"] = self.options.get_safe("szip_encoding", False)
@@ -284,7 +298,8 @@ class Hdf5Conan(ConanFile):
         self.cpp_info.components["hdf5_c"].includedirs.append(os.path.join("include", "hdf5"))
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["hdf5_c"].system_libs.extend(["dl", "m"])
-            if self.options.get_safe("threadsafe"):
+            if self.options.get_safe("threadsafe") or self.options.get_safe("enable_subfiling_vfd"):
+                # The subfiling VFD runs its I/O concentrators in a thread pool
                 self.cpp_info.components["hdf5_c"].system_libs.append("pthread")
         elif self.settings.os == "Windows":
             self.cpp_info.components["hdf5_c"].system_libs.append("Shlwapi")
@@ -21,6 +21,8 @@ class TestPackageConan(ConanFile):
         tc.variables.update({
             "HDF5_CXX": self.dependencies["hdf5"].options.enable_cxx,
             "HDF5_HL": self.dependencies["hdf5"].options.hl,
+            "HDF5_DIRECT_VFD": self.dependencies["hdf5"].options.get_safe("enable_direct_vfd", False),
+            "HDF5_SUBFILING_VFD": self.dependencies["hdf5"].options.get_safe("enable_subfiling_vfd", False),
         })
         tc.generate()
 
@@ -3,6 +3,8 @@
 
 extern void test_cxx_api();
 extern void test_parallel();
+extern int test_direct_vfd();
+extern int test_subfiling_vfd(int argc, char **argv);
 
 void test_c_api()
 {
@@ -41,7 +43,17 @@ int main(int argc, char **argv)
     printf("Testing C++ API\n");
     test_cxx_api();
     #endif
-    #ifdef CONAN_HDF5_PARALLEL
+    #ifdef CONAN_HDF5_DIRECT_VFD
+    printf("Testing HDF5 Direct VFD\n");
+    if (test_direct_vfd() != 0)
+        return 1;
+    #endif
+    #if defined(CONAN_HDF5_SUBFILING_VFD)
+    /* MPI can only be initialized once, the subfiling test also covers parallel writes */
+    printf("Testing HDF5 Subfiling VFD\n");
+    if (test_subfiling_vfd(argc, argv) != 0)
+        return 1;
+    #elif defined(CONAN_HDF5_PARALLEL)
     printf("Testing HDF5 Parallel\n");
     test_parallel(argc, argv);
     #endif
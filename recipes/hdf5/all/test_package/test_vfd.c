@@ -0,0 +1,104 @@
+#include "hdf5.h"
+#include <stdio.h>
+#include <stdlib.h>
+
+#define NX 256
+#define NY 1024
+#define CHUNK_NX 64
+#define CHUNK_NY 1024
+
+/* Writes and reads back a chunked dataset of NX x NY integers through the given file access property list */
+static int write_chunked_dataset(const char *filename, hid_t fapl_id)
+{
+    hid_t   file_id, space_id, dcpl_id, dset_id;
+    hsize_t dims[2]  = {NX, NY};
+    hsize_t chunk[2] = {CHUNK_NX, CHUNK_NY};
+    int    *data     = malloc(sizeof(int) * NX * NY);
+    int    *read     = malloc(sizeof(int) * NX * NY);
+    int     ret      = 1;
+    int     i;
+
+    for (i = 0; i < NX * NY; i++)
+        data[i] = i;
+
+    file_id = H5Fcreate(filename, H5F_ACC_TRUNC, H5P_DEFAULT, fapl_id);
+    if (file_id < 0) {
+        free(data);
+        free(read);
+        return -1;
+    }
+    space_id = H5Screate_simple(2, dims, NULL);
+    dcpl_id  = H5Pcreate(H5P_DATASET_CREATE);
+    H5Pset_chunk(dcpl_id, 2, chunk);
+    dset_id = H5Dcreate2(file_id, "/chunked", H5T_NATIVE_INT, space_id, H5P_DEFAULT, dcpl_id, H5P_DEFAULT);
+    if (dset_id >= 0 && H5Dwrite(dset_id, H5T_NATIVE_INT, H5S_ALL, H5S_ALL, H5P_DEFAULT, data) >= 0 &&
+        H5Dread(dset_id, H5T_NATIVE_INT, H5S_ALL, H5S_ALL, H5P_DEFAULT, read) >= 0) {
+        ret = 0;
+        for (i = 0; i < NX * NY; i++) {
+            if (read[i] != data[i]) {
+                ret = 1;
+                break;
+            }
+        }
+    }
+
+    H5Dclose(dset_id);
+    H5Pclose(dcpl_id);
+    H5Sclose(space_id);
+    H5Fclose(file_id);
+    free(data);
+    free(read);
+    return ret;
+}
+
+#ifdef CONAN_HDF5_DIRECT_VFD
+int test_direct_vfd()
+{
+    int   ret;
+    hid_t fapl_id = H5Pcreate(H5P_FILE_ACCESS);
+
+    /* 4 KiB alignment and block size, 16 MiB copy buffer */
+    H5Pset_fapl_direct(fapl_id, 4096, 4096, 16 * 1024 * 1024);
+    H5E_BEGIN_TRY
+    {
+        ret = write_chunked_dataset("direct.h5", fapl_id);
+    }
+    H5E_END_TRY
+    H5Pclose(fapl_id);
+
+    if (ret < 0) {
+        /* Some file systems like tmpfs don't support O_DIRECT */
+        printf("Direct VFD: O_DIRECT is not supported in the current directory, skipping\n");
+        return 0;
+    }
+    printf("Direct VFD: chunked dataset %s\n", ret == 0 ? "written and verified" : "mismatch");
+    return ret;
+}
+#endif
+
+#ifdef CONAN_HDF5_SUBFILING_VFD
+int test_subfiling_vfd(int argc, char **argv)
+{
+    int   ret      = 0;
+    int   provided = 0;
+    hid_t fapl_id;
+
+    /* The subfiling I/O concentrators run in their own threads */
+    MPI_Init_thread(&argc, &argv, MPI_THREAD_MULTIPLE, &provided);
+    if (provided != MPI_THREAD_MULTIPLE) {
+        printf("Subfiling VFD: MPI_THREAD_MULTIPLE is not available, skipping\n");
+        MPI_Finalize();
+        return 0;
+    }
+
+    fapl_id = H5Pcreate(H5P_FILE_ACCESS);
+    H5Pset_mpi_params(fapl_id, MPI_COMM_WORLD, MPI_INFO_NULL);
+    H5Pset_fapl_subfiling(fapl_id, NULL);
+    ret = write_chunked_dataset("subfiling.h5", fapl_id) != 0;
+    H5Pclose(fapl_id);
+    printf("Subfiling VFD: chunked dataset %s\n", ret == 0 ? "written and verified" : "failed");
+
+    MPI_Finalize();
+    return ret;
+}
+#endif
@@ -20,11 +20,34 @@ class HwlocConan(ConanFile):
     package_type = "shared-library"
     settings = "os", "arch", "compiler", "build_type"
     options = {
-        "with_libxml2": [True, False]
+        "with_libxml2": [True, False],
+        "with_cpuid": [True, False],
+        "with_pci": [True, False],
+        "with_libnuma": [True, False],
+        "plugins": [True, False],
     }
     default_options = {
-        "with_libxml2": False
+        "with_libxml2": False,
+        "with_cpuid": True,
+        "with_pci": False,
+        "with_libnuma": False,
+        "plugins": False,
     }
+    options_description = {
+        "with_cpuid": "Build the x86 CPUID backend, which discovers caches and cores by running CPUID on each processor",
+        "with_pci": "Discover PCI devices and their locality with libpciaccess",
+        "with_libnuma": "Link with libnuma so that the hwloc/linux-libnuma.h helpers can be used",
+        "plugins": "Build the optional backends (libxml2, PCI) as plugins loaded at runtime from lib/hwloc",
+    }
+
+    def config_options(self):
+        if self.settings.os == "Windows" or self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.with_cpuid
+        if self.settings.os != "Linux":
+            del self.options.with_pci
+            del self.options.with_libnuma
+        if self.settings.os == "Windows":
+            del self.options.plugins
 
     def configure(self):
         self.settings.rm_safe("compiler.cppstd")
@@ -33,6 +56,11 @@ class HwlocConan(ConanFile):
     def requirements(self):
         if self.options.with_libxml2:
             self.requires("libxml2/[>=2.12.5 <3]")
+        if self.options.get_safe("with_pci"):
+            self.requires("libpciaccess/0.17")
+        if self.options.get_safe("with_libnuma"):
+            # linux-libnuma.h includes numa.h and its inline helpers call libnuma
+            self.requires("libnuma/2.0.19", transitive_headers=True, transitive_libs=True)
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -63,7 +91,17 @@ class HwlocConan(ConanFile):
             tc = AutotoolsToolchain(self)
             if not self.options.with_libxml2:
                 tc.configure_args.extend(["--disable-libxml2"])
-            tc.configure_args.extend(["--disable-io", "--disable-cairo"])
+            if not self.options.get_safe("with_cpuid", True):
+                tc.configure_args.append("--disable-cpuid")
+            if self.options.get_safe("with_pci"):
+                # Only PCI discovery, other I/O backends would pick up system libraries
+                tc.configure_args.extend(["--enable-pci", "--disable-opencl", "--disable-cuda", "--disable-nvml",
+                                          "--disable-rsmi", "--disable-levelzero", "--disable-gl", "--disable-libudev"])
+            else:
+                tc.configure_args.append("--disable-io")
+            if self.options.plugins:
+                tc.configure_args.append("--enable-plugins")
+            tc.configure_args.append("--disable-cairo")
             tc.configure_args.extend(["--enable-shared", "--disable-static"])
             tc.generate()
 
@@ -93,6 +131,7 @@ class HwlocConan(ConanFile):
 
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rm(self, "*.la", os.path.join(self.package_folder, "lib"))
+        rm(self, "*.la", os.path.join(self.package_folder, "lib", "hwloc"))
         rmdir(self, os.path.join(self.package_folder, "share"))
 
     def package_info(self):
@@ -100,3 +139,6 @@ class HwlocConan(ConanFile):
         self.cpp_info.libs = ["hwloc"]
         if is_apple_os(self):
             self.cpp_info.frameworks = ['IOKit', 'Foundation', 'CoreFoundation']
+        if self.options.get_safe("plugins"):
+            # The library looks up the plugins in <prefix>/lib/hwloc, which is not the package folder
+            self.runenv_info.define_path("HWLOC_PLUGINS_PATH", os.path.join(self.package_folder, "lib", "hwloc"))
@@ -1,9 +1,45 @@
 #include <hwloc.h>
 
+#include <stdio.h>
+#include <time.h>
+
+static double now(void) {
+    struct timespec ts;
+    timespec_get(&ts, TIME_UTC);
+    return (double)ts.tv_sec + (double)ts.tv_nsec / 1e9;
+}
+
+static int count(hwloc_topology_t topology, hwloc_obj_type_t type) {
+    int depth = hwloc_get_type_depth(topology, type);
+    if (depth == HWLOC_TYPE_DEPTH_UNKNOWN || depth == HWLOC_TYPE_DEPTH_MULTIPLE)
+        return 0;
+    return hwloc_get_nbobjs_by_depth(topology, depth);
+}
+
 int main(void) {
     hwloc_topology_t topology;
+    double start, load_time;
 
     hwloc_topology_init(&topology);
+#ifdef TEST_HWLOC_PCI
+    hwloc_topology_set_io_types_filter(topology, HWLOC_TYPE_FILTER_KEEP_IMPORTANT);
+#endif
+    start = now();
+    if (hwloc_topology_load(topology) != 0) {
+        printf("hwloc_topology_load failed\n");
+        hwloc_topology_destroy(topology);
+        return 1;
+    }
+    load_time = now() - start;
+
+    printf("hwloc %s, topology loaded in %.2f ms\n", HWLOC_VERSION, load_time * 1000.0);
+    printf("packages: %d, NUMA nodes: %d, cores: %d, PUs: %d\n",
+           count(topology, HWLOC_OBJ_PACKAGE), count(topology, HWLOC_OBJ_NUMANODE),
+           count(topology, HWLOC_OBJ_CORE), count(topology, HWLOC_OBJ_PU));
+#ifdef TEST_HWLOC_PCI
+    printf("PCI devices: %d\n", count(topology, HWLOC_OBJ_PCI_DEVICE));
+#endif
+
     hwloc_topology_destroy(topology);
 
     return 0;
@@ -35,6 +35,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "enable_stats": [True, False],
+        "malloc_conf": [None, "ANY"],
+        "lg_page": [None, "ANY"],
+        "lg_hugepage": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -50,6 +54,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "enable_stats": True,
+        "malloc_conf": None,
+        "lg_page": None,
+        "lg_hugepage": None,
     }
 
     @property
@@ -120,7 +128,12 @@ class JemallocConan(ConanFile):
             if self.options.enable_cxx and self.settings.compiler.get_safe("libcxx") == "libc++" and \
                     Version(self.settings.compiler.version) < "10":
                 raise ConanInvalidConfiguration("Clang 9 or earlier with libc++ is not supported due to the missing mutex implementation.")
-        # 3: Apple Silicon specific checks
+        # 3. Page sizes are given as base 2 logarithms, e.g. 16 for 64 KiB pages
+        for option in ("lg_page", "lg_hugepage"):
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"{option} must be a base 2 logarithm of the page size, got '{value}'")
+        # 4. Apple Silicon specific checks
         if self.settings.os == "Macos" and self.settings.arch == "armv8":
             if Version(self.version) < "5.3.0":
                 raise ConanInvalidConfiguration("Support for Apple Silicon is only available as of 5.3.0.")
@@ -146,7 +159,15 @@ class JemallocConan(ConanFile):
             enable_disable("initial-exec-tls", self.options.enable_initial_exec_tls),
             enable_disable("libdl", self.options.enable_libdl),
             enable_disable("prof", self.options.enable_prof),
+            enable_disable("stats", self.options.enable_stats),
         ])
+        if self.options.malloc_conf:
+            # Built-in defaults, still overridden at runtime by the MALLOC_CONF environment variable
+            tc.configure_args.append(f"--with-malloc-conf={self.options.malloc_conf}")
+        if self.options.lg_page:
+            tc.configure_args.append(f"--with-lg-page={self.options.lg_page}")
+        if self.options.lg_hugepage:
+            tc.configure_args.append(f"--with-lg-hugepage={self.options.lg_hugepage}")
         env = tc.environment()
         if is_msvc(self):
             # Do not check whether the math library exists when compiled by MSVC
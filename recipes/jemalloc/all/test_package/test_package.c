@@ -1,12 +1,80 @@
 #include <jemalloc/jemalloc.h>
 
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdio.h>
 #include <stdlib.h>
+#include <time.h>
+
+#define ITERATIONS 1000000
+#define LIVE_ALLOCATIONS 1024
 
 void do_something(size_t i) {
     // Leak some memory.
     malloc(i * 100);
 }
 
+static void print_size_t(const char *name) {
+    size_t value;
+    size_t len = sizeof(value);
+    if (mallctl(name, &value, &len, NULL, 0) == 0) {
+        printf("%s: %zu\n", name, value);
+    }
+}
+
+static void print_unsigned(const char *name) {
+    unsigned value;
+    size_t len = sizeof(value);
+    if (mallctl(name, &value, &len, NULL, 0) == 0) {
+        printf("%s: %u\n", name, value);
+    }
+}
+
+static void print_bool(const char *name) {
+    bool value;
+    size_t len = sizeof(value);
+    if (mallctl(name, &value, &len, NULL, 0) == 0) {
+        printf("%s: %s\n", name, value ? "true" : "false");
+    }
+}
+
+// Small allocations with a working set of live objects, reported with the configured defaults
+static void benchmark(void) {
+    void *live[LIVE_ALLOCATIONS] = {0};
+    uint64_t epoch = 1;
+    size_t len = sizeof(epoch);
+    clock_t start = clock();
+    double seconds;
+
+    for (size_t i = 0; i < ITERATIONS; i++) {
+        size_t slot = (i * 7919) % LIVE_ALLOCATIONS;
+        if (live[slot] != NULL) {
+            dallocx(live[slot], 0);
+        }
+        live[slot] = mallocx(16 + (i % 64) * 16, 0);
+    }
+    seconds = (double)(clock() - start) / CLOCKS_PER_SEC;
+    for (size_t i = 0; i < LIVE_ALLOCATIONS; i++) {
+        if (live[i] != NULL) {
+            dallocx(live[i], 0);
+        }
+    }
+
+    printf("allocations: %d in %.3f s", ITERATIONS, seconds);
+    if (seconds > 0) {
+        printf(" (%.1f M/s)", ITERATIONS / seconds / 1e6);
+    }
+    printf("\n");
+
+    print_bool("opt.background_thread");
+    print_size_t("arenas.page");
+    print_unsigned("opt.narenas");
+    // Statistics are only refreshed on an epoch update, and not available with enable_stats=False
+    mallctl("epoch", &epoch, &len, &epoch, len);
+    print_size_t("stats.allocated");
+    print_size_t("stats.resident");
+}
+
 int main() {
     for (size_t i = 0; i < 1000; i++) {
         do_something(i);
@@ -15,5 +83,7 @@ int main() {
     // Dump allocator statistics to stderr.
     malloc_stats_print(NULL, NULL, NULL);
 
+    benchmark();
+
     return 0;
 }
@@ -8,6 +8,7 @@ from conan.tools.files import copy, download, get, load, replace_in_file, rm, rm
 from conan.tools.gnu import Autotools, AutotoolsToolchain, AutotoolsDeps, PkgConfigDeps
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, unix_path
+from conan.tools.scm import Version
 
 import os
 import re
@@ -53,6 +54,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
         "with_nghttp2": [True, False],
+        "with_http3": [False, "openssl"],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
@@ -75,6 +77,7 @@ class LibcurlConan(ConanFile):
         "with_ca_fallback": [True, False],
         "with_form_api": [True, False],
         "with_websockets": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
@@ -102,6 +105,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": False,
         "with_largemaxwritesize": False,
         "with_nghttp2": False,
+        "with_http3": False,
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
@@ -124,6 +128,7 @@ class LibcurlConan(ConanFile):
         "with_ca_fallback": False,
         "with_form_api": True,
         "with_websockets": True,
+        "lto": False,
     }
 
     @property
@@ -170,6 +175,8 @@ class LibcurlConan(ConanFile):
             self.requires("mbedtls/3.5.0")
         if self.options.with_nghttp2:
             self.requires("libnghttp2/[>=1.59.0 <2]")
+        if self.options.with_http3:
+            self.requires("nghttp3/[>=1.1.0 <2]")
         if self.options.with_libssh2:
             self.requires("libssh2/1.11.0")
         if self.options.with_zlib:
@@ -195,6 +202,11 @@ class LibcurlConan(ConanFile):
             openssl = self.dependencies["openssl"]
             if self.options.with_ntlm and openssl.options.no_des:
                 raise ConanInvalidConfiguration("option with_ntlm=True requires openssl/*:no_des=False")
+        if self.options.with_http3 == "openssl":
+            if self.options.with_ssl != "openssl":
+                raise ConanInvalidConfiguration("option with_http3=openssl requires with_ssl=openssl")
+            if Version(self.dependencies["openssl"].ref.version) < "3.3.0":
+                raise ConanInvalidConfiguration("option with_http3=openssl requires openssl >= 3.3.0 for its QUIC client API")
         if self.options.with_ssl == "wolfssl" and not self.dependencies["wolfssl"].options.with_curl:
             raise ConanInvalidConfiguration("option with_ssl=wolfssl requires wolfssl/*:with_curl=True")
 
@@ -333,6 +345,11 @@ class LibcurlConan(ConanFile):
         replace_in_file(self, cmakelists, "${NGHTTP2_INCLUDE_DIRS}", "${libnghttp2_INCLUDE_DIRS}")
         replace_in_file(self, cmakelists, "${NGHTTP2_LIBRARIES}", "libnghttp2::nghttp2")
 
+        # nghttp3
+        replace_in_file(self, cmakelists, "find_package(NGHTTP3 REQUIRED)", "find_package(nghttp3 REQUIRED CONFIG)")
+        replace_in_file(self, cmakelists, "${NGHTTP3_INCLUDE_DIRS}", "${nghttp3_INCLUDE_DIRS}", strict=False)
+        replace_in_file(self, cmakelists, "${NGHTTP3_LIBRARIES}", "nghttp3::nghttp3")
+
         # wolfssl
         replace_in_file(self, cmakelists, "find_package(WolfSSL REQUIRED)", "find_package(wolfssl REQUIRED CONFIG)")
         replace_in_file(self, cmakelists, "${WOLFSSL_LIBRARIES}", "${wolfssl_LIBRARIES}")
@@ -433,6 +450,12 @@ class LibcurlConan(ConanFile):
         else:
             tc.configure_args.append("--without-nghttp2")
 
+        if self.options.with_http3 == "openssl":
+            path = unix_path(self, self.dependencies["nghttp3"].package_folder)
+            tc.configure_args.extend(["--with-openssl-quic", f"--with-nghttp3={path}"])
+        else:
+            tc.configure_args.append("--without-nghttp3")
+
         if self.options.with_zlib:
             path = unix_path(self, self.dependencies["zlib"].package_folder)
             tc.configure_args.append(f"--with-zlib={path}")
@@ -520,6 +543,13 @@ class LibcurlConan(ConanFile):
         if cross_building(self) and is_apple_os(self):
             tc.extra_defines.extend(['HAVE_SOCKET', 'HAVE_FCNTL_O_NONBLOCK'])
 
+        if self.options.lto:
+            tc.extra_cflags.append("-flto")
+            tc.extra_ldflags.append("-flto")
+            if self.settings.compiler == "gcc" and not self.options.shared:
+                # Also emit regular code so the static libcurl links without -flto
+                tc.extra_cflags.append("-ffat-lto-objects")
+
         tc.generate(env)
         tc = PkgConfigDeps(self)
         tc.generate()
@@ -566,6 +596,7 @@ class LibcurlConan(ConanFile):
         tc.variables["CURL_USE_WOLFSSL"] = self.options.with_ssl == "wolfssl"
         tc.variables["CURL_USE_MBEDTLS"] = self.options.with_ssl == "mbedtls"
         tc.variables["USE_NGHTTP2"] = self.options.with_nghttp2
+        tc.variables["USE_OPENSSL_QUIC"] = self.options.with_http3 == "openssl"
         tc.variables["CURL_ZLIB"] = self.options.with_zlib
         tc.variables["CURL_BROTLI"] = self.options.with_brotli
         tc.variables["CURL_ZSTD"] = self.options.with_zstd
@@ -618,6 +649,13 @@ class LibcurlConan(ConanFile):
         if is_msvc(self):
             tc.cache_variables["CMAKE_TRY_COMPILE_CONFIGURATION"] = str(self.settings.build_type)
 
+        if self.options.lto:
+            if self.settings.compiler == "gcc" and not self.options.shared:
+                # Static gcc build: bypass CMake IPO, whose -fno-fat-lto-objects would force -flto onto every consumer
+                tc.extra_cflags.extend(["-flto", "-ffat-lto-objects"])
+            else:
+                tc.cache_variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
+
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -714,6 +752,8 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("mbedtls::mbedtls")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.with_http3:
+            self.cpp_info.components["curl"].requires.append("nghttp3::nghttp3")
         if self.options.with_libssh2:
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_zlib:
@@ -3,6 +3,13 @@
 
 int main(void)
 {
+  curl_version_info_data *info = curl_version_info(CURLVERSION_NOW);
   printf("libcurl version %s\n", curl_version());
-  return 0;
+  int http3 = (info->features & CURL_VERSION_HTTP3) != 0;
+  printf("HTTP/3 support: %s\n", http3 ? "yes" : "no");
+#ifdef TEST_HTTP3
+  return http3 ? 0 : 1;
+#else
+  return http3 ? 1 : 0;
+#endif
 }
@@ -28,6 +28,15 @@ class LlamaCppConan(ConanFile):
         "with_examples": [True, False],
         "with_cuda": [True, False],
         "with_curl": [True, False],
+        "with_openmp": [True, False],
+        "with_blas": [False, "openblas", "accelerate"],
+        "cpu_native": [True, False],
+        "cpu_avx": [True, False],
+        "cpu_avx2": [True, False],
+        "cpu_avx512": [True, False],
+        "cpu_f16c": [True, False],
+        "cpu_fma": [True, False],
+        "cpu_all_variants": [True, False],
     }
     default_options = {
         "shared": False,
@@ -35,9 +44,32 @@ class LlamaCppConan(ConanFile):
         "with_examples": False,
         "with_cuda": False,
         "with_curl": False,
+        "with_openmp": True,
+        "with_blas": False,
+        "cpu_native": True,
+        "cpu_avx": False,
+        "cpu_avx2": False,
+        "cpu_avx512": False,
+        "cpu_f16c": False,
+        "cpu_fma": False,
+        "cpu_all_variants": False,
+    }
+    options_description = {
+        "with_openmp": "Use OpenMP for the CPU backend threads (GGML_OPENMP)",
+        "with_blas": "Build the BLAS backend with the given BLAS library (GGML_BLAS, GGML_BLAS_VENDOR)",
+        "cpu_native": "Optimize the CPU backend for the build machine (GGML_NATIVE), ignored when cross-building",
+        "cpu_avx": "Enable AVX in the CPU backend when cpu_native=False (GGML_AVX)",
+        "cpu_avx2": "Enable AVX2 in the CPU backend when cpu_native=False (GGML_AVX2)",
+        "cpu_avx512": "Enable AVX512F in the CPU backend when cpu_native=False (GGML_AVX512)",
+        "cpu_f16c": "Enable F16C in the CPU backend when cpu_native=False (GGML_F16C)",
+        "cpu_fma": "Enable FMA in the CPU backend when cpu_native=False (GGML_FMA)",
+        "cpu_all_variants": "Build one CPU backend per microarchitecture, loaded at runtime with ggml_backend_load_all() "
+                            "(GGML_CPU_ALL_VARIANTS, GGML_BACKEND_DL)",
     }
 
-    implements = ["auto_shared_fpic"]
+    @property
+    def _cpu_features(self):
+        return ["avx", "avx2", "avx512", "f16c", "fma"]
 
     @property
     def _is_new_llama(self):
@@ -62,8 +94,38 @@ class LlamaCppConan(ConanFile):
     def export_sources(self):
         export_conandata_patches(self)
 
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+        if self.settings.arch not in ("x86", "x86_64"):
+            for feature in self._cpu_features:
+                self.options.rm_safe(f"cpu_{feature}")
+        if not self._is_new_llama:
+            del self.options.cpu_all_variants
+        if is_apple_os(self):
+            # Matches upstream defaults: Accelerate is used for BLAS, apple-clang has no OpenMP
+            self.options.with_blas = "accelerate"
+            self.options.with_openmp = False
+
+    def configure(self):
+        if self.options.shared:
+            self.options.rm_safe("fPIC")
+        if self.options.get_safe("cpu_all_variants"):
+            self.options.rm_safe("cpu_native")
+        if self.options.get_safe("cpu_all_variants") or self.options.get_safe("cpu_native"):
+            for feature in self._cpu_features:
+                self.options.rm_safe(f"cpu_{feature}")
+
     def validate(self):
         check_min_cppstd(self, 17 if self._is_new_llama else 11)
+        if self.options.with_blas == "accelerate" and not is_apple_os(self):
+            raise ConanInvalidConfiguration("with_blas=accelerate is only available on Apple platforms")
+        if self.options.get_safe("cpu_all_variants"):
+            # CPU variants are built as modules, dlopen'ed by ggml at runtime
+            if not self.options.shared:
+                raise ConanInvalidConfiguration("cpu_all_variants=True requires shared=True")
+            if self.settings.arch != "x86_64":
+                raise ConanInvalidConfiguration("cpu_all_variants=True is only available for x86_64")
 
     def validate_build(self):
         if self._is_new_llama and self.settings.compiler == "msvc" and "arm" in self.settings.arch:
@@ -75,6 +137,10 @@ class LlamaCppConan(ConanFile):
     def requirements(self):
         if self.options.with_curl:
             self.requires("libcurl/[>=7.78 <9]")
+        if self.options.with_blas == "openblas":
+            self.requires("openblas/0.3.30")
+        if self.options.with_openmp and self.settings.compiler in ("clang", "apple-clang"):
+            self.requires("llvm-openmp/20.1.6")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -98,6 +164,25 @@ class LlamaCppConan(ConanFile):
         # right now it tries to add_subdirectory to a non-existent folder
         tc.variables["GGML_BUILD_EXAMPLES"] = False
         tc.variables["GGML_CUDA"] = self.options.get_safe("with_cuda")
+        tc.variables["GGML_OPENMP"] = self.options.with_openmp
+        tc.variables["GGML_BLAS"] = bool(self.options.with_blas)
+        if self.options.with_blas == "openblas":
+            tc.variables["GGML_BLAS_VENDOR"] = "OpenBLAS"
+            openblas_cpp_info = self.dependencies["openblas"].cpp_info.aggregated_components()
+            tc.variables["BLAS_INCLUDE_DIRS"] = ";".join(p.replace("\\", "/") for p in openblas_cpp_info.includedirs)
+        elif self.options.with_blas == "accelerate":
+            tc.variables["GGML_BLAS_VENDOR"] = "Apple"
+
+        if self.options.get_safe("cpu_all_variants"):
+            tc.variables["GGML_NATIVE"] = False
+            tc.variables["GGML_BACKEND_DL"] = True
+            tc.variables["GGML_CPU_ALL_VARIANTS"] = True
+        elif not self.options.cpu_native or cross_building(self):
+            tc.variables["GGML_NATIVE"] = False
+            # Set explicitly, upstream turns them on by default when GGML_NATIVE is disabled on a non cross build
+            for feature in self._cpu_features:
+                if self.options.get_safe(f"cpu_{feature}") is not None:
+                    tc.variables[f"GGML_{feature.upper()}"] = self.options.get_safe(f"cpu_{feature}")
         tc.generate()
 
     def build(self):
@@ -123,9 +208,13 @@ class LlamaCppConan(ConanFile):
             save(self, os.path.join(self.package_folder, "lib", "cmake", "llama-cpp-cuda-static.cmake"), self._cuda_build_module)
 
     def _get_backends(self):
+        if self.options.get_safe("cpu_all_variants"):
+            # With GGML_BACKEND_DL all backends are modules loaded at runtime, not linked
+            return []
         results = ["cpu"]
-        if is_apple_os(self):
+        if self.options.with_blas:
             results.append("blas")
+        if is_apple_os(self):
             results.append("metal")
         if self.options.with_cuda:
             results.append("cuda")
@@ -153,7 +242,7 @@ class LlamaCppConan(ConanFile):
         if is_apple_os(self):
             self.cpp_info.components["common"].frameworks.extend(["Foundation", "Accelerate", "Metal"])
         elif self.settings.os in ("Linux", "FreeBSD"):
-            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread", "gomp"])
+            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread"])
 
         if self.options.with_cuda and not self.options.shared:
             self.cpp_info.builddirs.append(os.path.join("lib", "cmake"))
@@ -186,7 +275,18 @@ class LlamaCppConan(ConanFile):
                 self.cpp_info.components["ggml"].requires.append(f"ggml-{backend}")
 
             if is_apple_os(self):
-                if "blas" in backends:
-                    self.cpp_info.components["ggml-blas"].frameworks.append("Accelerate")
                 if "metal" in backends:
                     self.cpp_info.components["ggml-metal"].frameworks.extend(["Metal", "MetalKit", "Foundation", "CoreFoundation"])
+
+        # Components actually linking BLAS and OpenMP, ggml itself when they are built into it or loaded as modules
+        blas_component = "ggml-blas" if "ggml-blas" in self.cpp_info.components else "ggml"
+        if self.options.with_blas == "openblas":
+            self.cpp_info.components[blas_component].requires.append("openblas::openblas")
+        elif self.options.with_blas == "accelerate":
+            self.cpp_info.components[blas_component].frameworks.append("Accelerate")
+        if self.options.with_openmp:
+            openmp_component = "ggml-cpu" if "ggml-cpu" in self.cpp_info.components else "ggml"
+            if self.settings.compiler in ("clang", "apple-clang"):
+                self.cpp_info.components[openmp_component].requires.append("llvm-openmp::llvm-openmp")
+            elif self.settings.compiler == "gcc":
+                self.cpp_info.components[openmp_component].system_libs.append("gomp")
@@ -2,20 +2,29 @@ import os
 
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
+    @property
+    def _backend_dl(self):
+        return self.dependencies["llama-cpp"].options.get_safe("cpu_all_variants", False)
+
     def requirements(self):
         self.requires(self.tested_reference_str)
 
     def layout(self):
         cmake_layout(self)
 
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["TEST_GGML_BACKEND_DL"] = self._backend_dl
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -23,5 +32,7 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if can_run(self):
-            bin_path = os.path.join(self.cpp.build.bindir, "test_package")
-            self.run(bin_path, env="conanrun")
+            bin_path = os.path.join(self.build_folder, self.cpp.build.bindir, "test_package")
+            # ggml_backend_load_all() looks for the backend modules next to the executable and in the working directory
+            cwd = self.dependencies["llama-cpp"].cpp_info.bindirs[0] if self._backend_dl else None
+            self.run(bin_path, env="conanrun", cwd=cwd)
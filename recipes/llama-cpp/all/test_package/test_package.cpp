@@ -1,8 +1,23 @@
 #include "llama.h"
 #include <iostream>
+#ifdef TEST_GGML_BACKEND_DL
+#include "ggml-backend.h"
+#endif
+
 int main() {
   llama_model_params params = llama_model_default_params();
   std::cout << "Main GPU: " << params.main_gpu << std::endl;
 
+#ifdef TEST_GGML_BACKEND_DL
+  // Picks the best ggml-cpu-<variant> module for this machine, from the working directory
+  ggml_backend_load_all();
+  ggml_backend_dev_t cpu = ggml_backend_dev_by_type(GGML_BACKEND_DEVICE_TYPE_CPU);
+  if (cpu == nullptr) {
+    std::cerr << "No CPU backend could be loaded" << std::endl;
+    return 1;
+  }
+  std::cout << "CPU backend: " << ggml_backend_dev_description(cpu) << std::endl;
+#endif
+
   return 0;
 }
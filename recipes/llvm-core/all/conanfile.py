@@ -154,6 +154,8 @@ class LLVMCoreConan(ConanFile):
         "unwind_tables": [True, False],
         "expensive_checks": [True, False],
         "use_perf": [True, False],
+        "split_dwarf": [True, False],
+        "compress_debug_sections": ["none", "zlib", "zstd"],
         "use_sanitizer": [
             "Address",
             "Memory",
@@ -185,6 +187,8 @@ class LLVMCoreConan(ConanFile):
         "unwind_tables": True,
         "expensive_checks": False,
         "use_perf": False,
+        "split_dwarf": False,
+        "compress_debug_sections": "none",
         "use_sanitizer": "None",
         "with_libedit": True,
         "with_ffi": False,
@@ -225,6 +229,10 @@ class LLVMCoreConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.fPIC
             del self.options.with_libedit  # not supported on windows
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            # -gsplit-dwarf and --compress-debug-sections are ELF specific
+            del self.options.split_dwarf
+            del self.options.compress_debug_sections
         if Version(self.version) < 15:
             # Added by https://reviews.llvm.org/D128465
             del self.options.with_zstd
@@ -278,6 +286,20 @@ class LLVMCoreConan(ConanFile):
         if self.options.exceptions and not self.options.rtti:
             raise ConanInvalidConfiguration("Cannot enable exceptions without rtti support")
 
+        if self.options.get_safe("split_dwarf") and not self.options.shared:
+            # The objects inside the static libraries would reference .dwo files of the build folder
+            raise ConanInvalidConfiguration("split_dwarf requires shared=True")
+
+        if self.options.get_safe("compress_debug_sections") == "zstd":
+            # -gz=zstd was added in gcc 13 and clang 16
+            minimum_version = {"gcc": "13", "clang": "16"}.get(str(self.settings.compiler))
+            if minimum_version and Version(self.settings.compiler.version) < minimum_version:
+                raise ConanInvalidConfiguration(f"compress_debug_sections=zstd requires {self.settings.compiler} >= {minimum_version}")
+            link_flags = self.conf.get("tools.build:sharedlinkflags", default=[], check_type=list) + \
+                         self.conf.get("tools.build:exelinkflags", default=[], check_type=list)
+            if "-fuse-ld=gold" in link_flags:
+                raise ConanInvalidConfiguration("compress_debug_sections=zstd is not supported by the gold linker")
+
         if cross_building(self):
             # FIXME support cross compilation
             #  For Cross Building, LLVM builds a "native" toolchain in a subdirectory of the main build directory.
@@ -385,6 +407,33 @@ class LLVMCoreConan(ConanFile):
                 "LLVM_ENABLE_PIC": self.options.get_safe("fPIC", default=True)
             })
 
+        if self.options.get_safe("split_dwarf"):
+            # Keeps the bulk of the DWARF out of the objects and the linker, only
+            # meaningful for build types with debug information
+            cmake_variables["LLVM_USE_SPLIT_DWARF"] = True
+            # Used in package() to gather the .dwo files
+            cmake_variables["LLVM_TOOL_LLVM_DWP_BUILD"] = True
+
+        compress_debug_sections = self.options.get_safe("compress_debug_sections", "none")
+        if compress_debug_sections != "none":
+            # Added after project() rather than to the toolchain flags, so that an assembler or linker
+            # without support for the format fails with a clear message instead of in the compiler checks
+            compress_debug_sections_include = PurePosixPath(self.generators_folder) / "conan_compress_debug_sections.cmake"
+            save(self, compress_debug_sections_include, textwrap.dedent(f"""\
+                include(CheckCXXSourceCompiles)
+                set(CMAKE_REQUIRED_FLAGS "-gz={compress_debug_sections}")
+                set(CMAKE_REQUIRED_LINK_OPTIONS "LINKER:--compress-debug-sections={compress_debug_sections}")
+                check_cxx_source_compiles("int main() {{ return 0; }}" CONAN_COMPRESS_DEBUG_SECTIONS_SUPPORTED)
+                unset(CMAKE_REQUIRED_FLAGS)
+                unset(CMAKE_REQUIRED_LINK_OPTIONS)
+                if(NOT CONAN_COMPRESS_DEBUG_SECTIONS_SUPPORTED)
+                    message(FATAL_ERROR "compress_debug_sections={compress_debug_sections} is not supported by the assembler or the linker")
+                endif()
+                add_compile_options($<$<COMPILE_LANGUAGE:C,CXX>:-gz={compress_debug_sections}>)
+                add_link_options(LINKER:--compress-debug-sections={compress_debug_sections})
+            """))
+            cmake_variables["CMAKE_PROJECT_LLVM_INCLUDE"] = str(compress_debug_sections_include)
+
         if self.options.use_sanitizer == "None":
             cmake_variables["LLVM_USE_SANITIZER"] = ""
         else:
@@ -429,6 +478,9 @@ class LLVMCoreConan(ConanFile):
         else:
             cmake.configure(build_script_folder="llvm-main", cli_args=graphviz_args)
         cmake.build()
+        if self.options.get_safe("split_dwarf"):
+            # Not part of the default targets when tools are excluded with LLVM_BUILD_TOOLS=OFF
+            cmake.build(target="llvm-dwp")
 
     @property
     def _package_folder_path(self):
@@ -501,11 +553,29 @@ class LLVMCoreConan(ConanFile):
         with open(self._build_info_file, encoding="utf-8") as fp:
             return json.load(fp)
 
+    def _package_dwp(self):
+        # gdb and lldb look up <binary>.dwp next to each binary, gather the .dwo files
+        # it references from the build folder with the llvm-dwp that was just built
+        llvm_dwp = os.path.join(self.build_folder, "bin", "llvm-dwp")
+        for folder in ("bin", "lib"):
+            for binary in sorted(Path(self.package_folder, folder).iterdir()):
+                if binary.is_symlink() or not binary.is_file():
+                    continue
+                if folder == "lib" and ".so" not in binary.suffixes:
+                    continue
+                with open(binary, "rb") as f:
+                    if f.read(4) != b"\x7fELF":
+                        continue
+                self.run(f'"{llvm_dwp}" -e "{binary}" -o "{binary}.dwp"')
+
     def package(self):
         copy(self, "LICENSE.TXT", self._llvm_source_folder_path, self._package_folder_path / "licenses")
         cmake = CMake(self)
         cmake.install()
 
+        if self.options.get_safe("split_dwarf") and self.settings.build_type in ("Debug", "RelWithDebInfo"):
+            self._package_dwp()
+
         build_info = self._write_build_info()
 
         cmake_folder = self._package_folder_path / "lib" / "cmake" / "llvm"
@@ -21,10 +21,12 @@ class LZ4Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "lto": False,
     }
 
     def export_sources(self):
@@ -58,6 +60,13 @@ class LZ4Conan(ConanFile):
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
         # Honor BUILD_SHARED_LIBS (see https://github.com/conan-io/conan/issues/11840)
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
+        if self.options.lto:
+            if self.settings.compiler == "gcc" and not self.options.shared:
+                # gcc IPO objects from CMake are slim (-fno-fat-lto-objects), keep machine code in the static archive instead
+                tc.extra_cflags.extend(["-flto", "-ffat-lto-objects"])
+            else:
+                tc.cache_variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
+                tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
         if Version(self.version) < "1.10.0":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
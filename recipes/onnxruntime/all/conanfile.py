@@ -4,6 +4,7 @@ from conan.tools.apple import is_apple_os
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, replace_in_file
 from conan.tools.build import check_min_cppstd
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 from conan.tools.env import VirtualBuildEnv
 import os
@@ -28,12 +29,16 @@ class OnnxRuntimeConan(ConanFile):
         "fPIC": [True, False],
         "with_xnnpack": [True, False],
         "with_cuda": [True, False],
+        "with_mimalloc": [True, False],
+        "enable_cpu_fp16_ops": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_xnnpack": False,
         "with_cuda": False,
+        "with_mimalloc": False,
+        "enable_cpu_fp16_ops": False,
     }
     short_paths = True
 
@@ -68,6 +73,9 @@ class OnnxRuntimeConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if not is_msvc(self):
+            # onnxruntime_USE_MIMALLOC is only honored by MSVC builds
+            del self.options.with_mimalloc
 
     def configure(self):
         if self.options.shared:
@@ -112,6 +120,8 @@ class OnnxRuntimeConan(ConanFile):
                 self.requires("xnnpack/cci.20220801")
         if self.options.with_cuda:
             self.requires("cutlass/3.5.0")
+        if self.options.get_safe("with_mimalloc"):
+            self.requires("mimalloc/2.2.4")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -125,6 +135,15 @@ class OnnxRuntimeConan(ConanFile):
             raise ConanInvalidConfiguration(
                 f"{self.ref} requires onnx compiled with `-o onnx:disable_static_registration=True`."
             )
+        if self.options.get_safe("with_mimalloc"):
+            if self.options.with_cuda:
+                # upstream skips mimalloc in GPU builds
+                raise ConanInvalidConfiguration(f"{self.ref} can't use mimalloc with CUDA, set `-o onnxruntime:with_mimalloc=False`.")
+            mimalloc_options = self.dependencies["mimalloc"].options
+            if mimalloc_options.get_safe("inject") or mimalloc_options.get_safe("single_object"):
+                raise ConanInvalidConfiguration(
+                    f"{self.ref} links mimalloc as a library, it can't be used with `-o mimalloc:inject=True` or `-o mimalloc:single_object=True`."
+                )
 
     def validate_build(self):
         if self.version >= Version("1.15.0") and self.options.shared and sys.version_info[:2] < (3, 8):
@@ -155,6 +174,7 @@ class OnnxRuntimeConan(ConanFile):
         tc.variables["onnxruntime_USE_XNNPACK"] = self.options.with_xnnpack
 
         tc.variables["onnxruntime_USE_CUDA"] = self.options.with_cuda
+        tc.variables["onnxruntime_USE_MIMALLOC"] = self.options.get_safe("with_mimalloc", False)
         tc.variables["onnxruntime_BUILD_UNIT_TESTS"] = False
         tc.variables["onnxruntime_DISABLE_CONTRIB_OPS"] = False
         tc.variables["onnxruntime_USE_FLASH_ATTENTION"] = False
@@ -163,7 +183,7 @@ class OnnxRuntimeConan(ConanFile):
 
         tc.variables["onnxruntime_ARMNN_RELU_USE_CPU"] = False
         tc.variables["onnxruntime_ARMNN_BN_USE_CPU"] = False
-        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = False
+        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = self.options.enable_cpu_fp16_ops
         tc.variables["onnxruntime_ENABLE_EAGER_MODE"] = False
         tc.variables["onnxruntime_ENABLE_LAZY_TENSOR"] = False
 
@@ -179,6 +199,8 @@ class OnnxRuntimeConan(ConanFile):
         deps = CMakeDeps(self)
         deps.set_property("boost::headers", "cmake_target_name", "Boost::mp11")
         deps.set_property("flatbuffers", "cmake_target_name", "flatbuffers::flatbuffers")
+        # upstream links mimalloc-static, whatever the mimalloc linkage
+        deps.set_property("mimalloc", "cmake_target_name", "mimalloc-static")
         deps.generate()
 
         vbe = VirtualBuildEnv(self)
@@ -272,6 +294,8 @@ class OnnxRuntimeConan(ConanFile):
             self.cpp_info.requires.append("xnnpack::xnnpack")
         if self.options.with_cuda:
             self.cpp_info.requires.append("cutlass::cutlass")
+        if self.options.get_safe("with_mimalloc"):
+            self.cpp_info.requires.append("mimalloc::mimalloc")
 
         # https://github.com/microsoft/onnxruntime/blob/v1.16.0/cmake/CMakeLists.txt#L1759-L1763
         self.cpp_info.set_property("cmake_file_name", "onnxruntime")
@@ -2,7 +2,7 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.build import cross_building
-from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import copy, get, rmdir
 from conan.tools.microsoft import is_msvc_static_runtime, is_msvc
 from conan.tools.scm import Version
@@ -73,7 +73,9 @@ class OpenblasConan(ConanFile):
         "fPIC": [True, False],
         "build_lapack": [True, False],
         "build_relapack": [True, False],
-        "use_thread": [True, False],
+        "threading": ["none", "pthreads", "openmp"],
+        "num_threads": [None, "ANY"],
+        "use_thread": [True, False, "deprecated"],
         "use_locking": [True, False],
         "dynamic_arch": [True, False],
         "target": [None] + available_openblas_targets
@@ -83,7 +85,9 @@ class OpenblasConan(ConanFile):
         "fPIC": True,
         "build_lapack": True,
         "build_relapack": False,
-        "use_thread": True,
+        "threading": "pthreads",
+        "num_threads": None,
+        "use_thread": "deprecated",
         "use_locking": True,
         "dynamic_arch": False,
         "target": None,
@@ -91,8 +95,10 @@ class OpenblasConan(ConanFile):
     options_description = {
         "build_lapack": "Build LAPACK and LAPACKE",
         "build_relapack": "Build with ReLAPACK (recursive implementation of several LAPACK functions on top of standard LAPACK)",
-        "use_thread": "Enable threads support",
-        "use_locking": "Use locks even in single-threaded builds to make them callable from multiple threads",
+        "threading": "Threading backend: none (single-threaded), pthreads (OpenBLAS own thread pool) or openmp (share the OpenMP runtime of the application)",
+        "num_threads": "Maximum number of threads OpenBLAS may use (NUM_THREADS), defaults to the number of cores of the build machine",
+        "use_thread": "Deprecated, use threading instead",
+        "use_locking": "Use locks in single-threaded builds (threading=none) to make them callable from multiple threads",
         "dynamic_arch": "Include support for multiple CPU targets, with automatic selection at runtime (x86/x86_64, aarch64 or ppc only)",
         "target": "OpenBLAS TARGET variable (see TargetList.txt)",
     }
@@ -105,6 +111,13 @@ class OpenblasConan(ConanFile):
             return comp_exe["fortran"]
         return None
 
+    @property
+    def _threading(self):
+        # Options can't be modified after configure(), the deprecated use_thread is mapped here
+        if self.options.use_thread != "deprecated":
+            return "pthreads" if self.options.use_thread else "none"
+        return str(self.options.threading)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -113,6 +126,12 @@ class OpenblasConan(ConanFile):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+        if self.options.use_thread != "deprecated":
+            self.output.warning("use_thread option is deprecated, use threading instead.")
+        if self._threading != "none":
+            # Threaded builds are always thread-safe, USE_LOCKING only matters without threading
+            self.options.rm_safe("use_locking")
+
         # When cross-compiling, OpenBLAS requires explicitly setting TARGET
         if cross_building(self, skip_x64_x86=True) and not self.options.target:
             # Try inferring the target from settings.arch
@@ -121,6 +140,15 @@ class OpenblasConan(ConanFile):
                 self.output.warning(f'Setting OpenBLAS TARGET={target} based on settings.arch. This may result in suboptimal performance. Set the "{self.name}/*:target=XXX" option to silence this warning.')
                 self.options.target = target
 
+    def requirements(self):
+        if self._threading == "openmp" and self.settings.compiler in ("clang", "apple-clang"):
+            self.requires("llvm-openmp/20.1.6", transitive_headers=True, transitive_libs=True)
+
+    def package_id(self):
+        if self.info.options.use_thread != "deprecated":
+            self.info.options.threading = "pthreads" if self.info.options.use_thread else "none"
+        del self.info.options.use_thread
+
     def build_requirements(self):
         if Version(self.version) >= "0.3.29":
             self.tool_requires("cmake/[>=3.16 <4]")
@@ -132,6 +160,11 @@ class OpenblasConan(ConanFile):
             if self.settings.compiler not in ["gcc", "clang"]:
                 # ld: unknown option: --allow-multiple-definition on apple-clang
                 raise ConanInvalidConfiguration(f'"{self.name}/*:build_relapack=True" option is only supported for GCC and Clang')
+        if self._threading == "openmp" and is_msvc(self):
+            # MSVC only implements OpenMP 2.0, which OpenBLAS doesn't support
+            raise ConanInvalidConfiguration(f'"{self.name}/*:threading=openmp" option is not supported with MSVC')
+        if self.options.num_threads and (not str(self.options.num_threads).isdigit() or int(self.options.num_threads) < 1):
+            raise ConanInvalidConfiguration(f'"{self.name}/*:num_threads" option must be a positive integer')
 
     def validate_build(self):
         # If we're cross-compiling, and the user didn't provide the target, and
@@ -162,8 +195,11 @@ class OpenblasConan(ConanFile):
         tc.variables["BUILD_RELAPACK"] = self.options.build_relapack
 
         tc.variables["DYNAMIC_ARCH"] = self.options.dynamic_arch
-        tc.variables["USE_THREAD"] = self.options.use_thread
-        tc.variables["USE_LOCKING"] = self.options.use_locking
+        tc.variables["USE_THREAD"] = self._threading != "none"
+        tc.variables["USE_OPENMP"] = self._threading == "openmp"
+        tc.variables["USE_LOCKING"] = self.options.get_safe("use_locking", False)
+        if self.options.num_threads:
+            tc.variables["NUM_THREADS"] = self.options.num_threads
 
         tc.variables["MSVC_STATIC_CRT"] = is_msvc_static_runtime(self)
 
@@ -179,6 +215,13 @@ class OpenblasConan(ConanFile):
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
 
+        if self._threading == "openmp" and self.settings.compiler in ("clang", "apple-clang"):
+            deps = CMakeDeps(self)
+            # find_package(OpenMP) of OpenBLAS runs in module mode, it must get llvm-openmp instead of CMake's FindOpenMP
+            deps.set_property("llvm-openmp", "cmake_file_name", "OpenMP")
+            deps.set_property("llvm-openmp", "cmake_find_mode", "both")
+            deps.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -203,22 +246,31 @@ class OpenblasConan(ConanFile):
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
         # 'pthread' causes issues without namespace
-        cmake_component_name = "pthread" if self.options.use_thread else "serial"  # TODO: how to model this in CMakeDeps?
+        cmake_component_name = {
+            "none": "serial",
+            "pthreads": "pthread",
+            "openmp": "openmp",
+        }[self._threading]  # TODO: how to model this in CMakeDeps?
         self.cpp_info.components["openblas_component"].set_property("cmake_target_name", f"OpenBLAS::{cmake_component_name}")
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(os.path.join("include", "openblas"))
         self.cpp_info.components["openblas_component"].libs = [self._lib_name]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["openblas_component"].system_libs.append("m")
-            if self.options.use_thread:
+            if self._threading != "none":
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
             if self.options.build_lapack and self._fortran_compiler:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
+        if self._threading == "openmp":
+            if self.settings.compiler in ("clang", "apple-clang"):
+                self.cpp_info.components["openblas_component"].requires.append("llvm-openmp::llvm-openmp")
+            elif self.settings.compiler == "gcc":
+                self.cpp_info.components["openblas_component"].sharedlinkflags.append("-fopenmp")
+                self.cpp_info.components["openblas_component"].exelinkflags.append("-fopenmp")
 
         self.buildenv_info.define_path("OpenBLAS_HOME", self.package_folder)
         self.runenv_info.define_path("OpenBLAS_HOME", self.package_folder)
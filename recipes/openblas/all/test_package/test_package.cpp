@@ -1,5 +1,33 @@
 #include <cblas.h>
 #include <stdio.h>
+#include <stdlib.h>
+
+#include <vector>
+
+// Large enough for OpenBLAS to split the work across threads
+static int threaded_dgemm()
+{
+  const int n = 512;
+  std::vector<double> A(n * n, 1.0), B(n * n, 2.0), C(n * n, 0.0);
+  cblas_dgemm(CblasColMajor, CblasNoTrans, CblasNoTrans, n, n, n, 1.0, A.data(), n, B.data(), n, 0.0, C.data(), n);
+  for (int i = 0; i < n * n; i++) {
+    if (C[i] != 2.0 * n) {
+      printf("dgemm: unexpected result %lf at %d\n", C[i], i);
+      return 1;
+    }
+  }
+
+  // 0: sequential, 1: pthreads, 2: OpenMP
+  printf("OpenBLAS threading: %d, threads: %d\n", openblas_get_parallel(), openblas_get_num_threads());
+#ifdef OPENBLAS_NUM_THREADS_CAP
+  openblas_set_num_threads(OPENBLAS_NUM_THREADS_CAP * 2);
+  if (openblas_get_num_threads() > OPENBLAS_NUM_THREADS_CAP) {
+    printf("num_threads: %d threads in use, more than the %d allowed\n", openblas_get_num_threads(), OPENBLAS_NUM_THREADS_CAP);
+    return 1;
+  }
+#endif
+  return 0;
+}
 
 int main()
 {
@@ -12,4 +40,6 @@ int main()
   for(i=0; i<9; i++)
     printf("%lf ", C[i]);
   printf("\n");
+
+  return threaded_dgemm();
 }
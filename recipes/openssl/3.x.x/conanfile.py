@@ -32,6 +32,7 @@ class OpenSSLConan(ConanFile):
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
         "enable_trace": [True, False],
+        "enable_ktls": [True, False],
         "no_aria": [True, False],
         "no_apps": [True, False],
         "no_autoload_config": [True, False],
@@ -87,6 +88,7 @@ class OpenSSLConan(ConanFile):
         "no_ts": [True, False],
         "no_whirlpool": [True, False],
         "no_zlib": [True, False],
+        "lto": [True, False],
         "openssldir": [None, "ANY"],
         "tls_security_level": [None, 0, 1, 2, 3, 4, 5],
     }
@@ -115,6 +117,9 @@ class OpenSSLConan(ConanFile):
             self.options.rm_safe("enable_capieng")
         else:
             self.options.rm_safe("fPIC")
+        if self.settings.os != "Linux":
+            # Kernel TLS offload is only wired for Linux in this recipe
+            self.options.rm_safe("enable_ktls")
 
     def configure(self):
         if self.options.shared:
@@ -132,6 +137,8 @@ class OpenSSLConan(ConanFile):
     def validate(self):
         if self.settings.os == "iOS" and self.options.shared:
             raise ConanInvalidConfiguration("OpenSSL 3 does not support building shared libraries for iOS")
+        if self.options.get_safe("enable_ktls") and self.options.no_sock:
+            raise ConanInvalidConfiguration("enable_ktls=True requires no_sock=False")
 
     def build_requirements(self):
         if self.settings_build.os == "Windows":
@@ -406,7 +413,7 @@ class OpenSSLConan(ConanFile):
             ])
 
         for option_name in self.default_options.keys():
-            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2"):
+            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2", "lto"):
                 self.output.info(f"Activated option: {option_name}")
                 args.append(option_name.replace("_", "-"))
         return args
@@ -425,6 +432,17 @@ class OpenSSLConan(ConanFile):
             # See https://github.com/conan-io/conan-center-index/issues/27424
             tc.extra_ldflags.append("-headerpad_max_install_names")
 
+        if self.options.lto:
+            if is_msvc(self):
+                tc.extra_cflags.append("-GL")
+                tc.extra_ldflags.append("-LTCG")
+            else:
+                tc.extra_cflags.append("-flto")
+                tc.extra_ldflags.append("-flto")
+                if self.settings.compiler == "gcc" and not self.options.shared:
+                    # libcrypto.a/libssl.a must stay linkable by non-LTO consumers, which need non-GIMPLE code in the objects
+                    tc.extra_cflags.append("-ffat-lto-objects")
+
         self._create_targets(tc.cflags, tc.cxxflags, tc.defines, tc.ldflags)
         tc.generate(env)
 
@@ -25,6 +25,7 @@ class TestPackageConan(ConanFile):
         tc.cache_variables["OPENSSL_WITH_LEGACY"] = self._with_legacy()
         tc.cache_variables["OPENSSL_WITH_MD4"] = not self.dependencies["openssl"].options.no_md4
         tc.cache_variables["OPENSSL_WITH_RIPEMD160"] = not self.dependencies["openssl"].options.no_rmd160
+        tc.cache_variables["OPENSSL_WITH_KTLS"] = bool(self.dependencies["openssl"].options.get_safe("enable_ktls"))
         tc.generate()
 
     def build(self):
@@ -0,0 +1,192 @@
+#include <openssl/bio.h>
+#include <openssl/evp.h>
+#include <openssl/ssl.h>
+#include <openssl/x509.h>
+
+#include <arpa/inet.h>
+#include <fcntl.h>
+#include <netinet/in.h>
+#include <stdio.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#define PAYLOAD_SIZE 16384
+
+static int tcp_loopback_pair(int *client_fd, int *server_fd) {
+    struct sockaddr_in addr;
+    socklen_t addr_len = sizeof(addr);
+    int listen_fd = socket(AF_INET, SOCK_STREAM, 0);
+    if (listen_fd < 0)
+        return 1;
+
+    memset(&addr, 0, sizeof(addr));
+    addr.sin_family = AF_INET;
+    addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    addr.sin_port = 0;
+    if (bind(listen_fd, (struct sockaddr *)&addr, sizeof(addr)) != 0 ||
+        listen(listen_fd, 1) != 0 ||
+        getsockname(listen_fd, (struct sockaddr *)&addr, &addr_len) != 0) {
+        close(listen_fd);
+        return 1;
+    }
+
+    *client_fd = socket(AF_INET, SOCK_STREAM, 0);
+    if (*client_fd < 0 || connect(*client_fd, (struct sockaddr *)&addr, sizeof(addr)) != 0) {
+        close(listen_fd);
+        return 1;
+    }
+    *server_fd = accept(listen_fd, NULL, NULL);
+    close(listen_fd);
+    return *server_fd < 0;
+}
+
+static int set_nonblocking(int fd, int nonblocking) {
+    int flags = fcntl(fd, F_GETFL, 0);
+    if (flags < 0)
+        return 1;
+    flags = nonblocking ? (flags | O_NONBLOCK) : (flags & ~O_NONBLOCK);
+    return fcntl(fd, F_SETFL, flags) != 0;
+}
+
+static int self_signed_certificate(SSL_CTX *ctx) {
+    int ret = 1;
+    EVP_PKEY *pkey = EVP_RSA_gen(2048);
+    X509 *x509 = X509_new();
+    X509_NAME *name;
+
+    if (pkey == NULL || x509 == NULL)
+        goto end;
+    ASN1_INTEGER_set(X509_get_serialNumber(x509), 1);
+    X509_gmtime_adj(X509_getm_notBefore(x509), 0);
+    X509_gmtime_adj(X509_getm_notAfter(x509), 3600);
+    X509_set_pubkey(x509, pkey);
+    name = X509_get_subject_name(x509);
+    X509_NAME_add_entry_by_txt(name, "CN", MBSTRING_ASC, (const unsigned char *)"localhost", -1, -1, 0);
+    X509_set_issuer_name(x509, name);
+    if (X509_sign(x509, pkey, EVP_sha256()) == 0)
+        goto end;
+    if (SSL_CTX_use_certificate(ctx, x509) == 1 && SSL_CTX_use_PrivateKey(ctx, pkey) == 1)
+        ret = 0;
+
+end:
+    X509_free(x509);
+    EVP_PKEY_free(pkey);
+    return ret;
+}
+
+static int wants_retry(SSL *ssl, int result) {
+    int error = SSL_get_error(ssl, result);
+    return error == SSL_ERROR_WANT_READ || error == SSL_ERROR_WANT_WRITE;
+}
+
+static SSL_CTX *create_context(const SSL_METHOD *method) {
+    SSL_CTX *ctx = SSL_CTX_new(method);
+    if (ctx == NULL)
+        return NULL;
+    // TLS 1.2 with AES-GCM is the configuration supported by the widest range of kernels,
+    // the RSA key exchange keeps the test working when OpenSSL is built with no_ec
+    SSL_CTX_set_options(ctx, SSL_OP_ENABLE_KTLS);
+    SSL_CTX_set_max_proto_version(ctx, TLS1_2_VERSION);
+    SSL_CTX_set_cipher_list(ctx, "AES128-GCM-SHA256");
+    return ctx;
+}
+
+int ktls_sendfile() {
+    int ret = 1;
+    int client_fd = -1, server_fd = -1;
+    int client_done = 0, server_done = 0;
+    size_t received = 0;
+    unsigned char payload[PAYLOAD_SIZE], buffer[PAYLOAD_SIZE];
+    FILE *file = NULL;
+    SSL_CTX *client_ctx = create_context(TLS_client_method());
+    SSL_CTX *server_ctx = create_context(TLS_server_method());
+    SSL *client = NULL, *server = NULL;
+
+    if (client_ctx == NULL || server_ctx == NULL || self_signed_certificate(server_ctx) != 0) {
+        printf("kTLS: failed to create the SSL contexts\n");
+        goto end;
+    }
+    if (tcp_loopback_pair(&client_fd, &server_fd) != 0) {
+        printf("kTLS: failed to create a loopback connection\n");
+        goto end;
+    }
+
+    client = SSL_new(client_ctx);
+    server = SSL_new(server_ctx);
+    SSL_set_fd(client, client_fd);
+    SSL_set_fd(server, server_fd);
+
+    // Both peers live in this thread, so the handshake is driven step by step on non-blocking sockets
+    set_nonblocking(client_fd, 1);
+    set_nonblocking(server_fd, 1);
+    while (!client_done || !server_done) {
+        int result;
+        if (!client_done) {
+            result = SSL_connect(client);
+            if (result == 1)
+                client_done = 1;
+            else if (!wants_retry(client, result))
+                break;
+        }
+        if (!server_done) {
+            result = SSL_accept(server);
+            if (result == 1)
+                server_done = 1;
+            else if (!wants_retry(server, result))
+                break;
+        }
+    }
+    if (!client_done || !server_done) {
+        printf("kTLS: TLS handshake failed\n");
+        goto end;
+    }
+    set_nonblocking(client_fd, 0);
+    set_nonblocking(server_fd, 0);
+
+    if (!BIO_get_ktls_send(SSL_get_wbio(server))) {
+        // OpenSSL was built with kTLS, but the running kernel doesn't offer it (tls module not loaded)
+        printf("kTLS: send offload not available from the kernel, skipping SSL_sendfile\n");
+        ret = 0;
+        goto end;
+    }
+
+    for (size_t i = 0; i < sizeof(payload); ++i)
+        payload[i] = (unsigned char)(i * 31);
+    file = tmpfile();
+    if (file == NULL || fwrite(payload, 1, sizeof(payload), file) != sizeof(payload) || fflush(file) != 0) {
+        printf("kTLS: failed to write the payload file\n");
+        goto end;
+    }
+
+    if (SSL_sendfile(server, fileno(file), 0, sizeof(payload), 0) != (ossl_ssize_t)sizeof(payload)) {
+        printf("kTLS: SSL_sendfile failed\n");
+        goto end;
+    }
+    while (received < sizeof(buffer)) {
+        int result = SSL_read(client, buffer + received, (int)(sizeof(buffer) - received));
+        if (result <= 0)
+            break;
+        received += (size_t)result;
+    }
+    if (received != sizeof(payload) || memcmp(payload, buffer, sizeof(payload)) != 0) {
+        printf("kTLS: received data doesn't match the sent file\n");
+        goto end;
+    }
+
+    printf("kTLS: SSL_sendfile sent %zu bytes through the kernel\n", received);
+    ret = 0;
+
+end:
+    if (file != NULL)
+        fclose(file);
+    SSL_free(client);
+    SSL_free(server);
+    SSL_CTX_free(client_ctx);
+    SSL_CTX_free(server_ctx);
+    if (client_fd >= 0)
+        close(client_fd);
+    if (server_fd >= 0)
+        close(server_fd);
+    return ret;
+}
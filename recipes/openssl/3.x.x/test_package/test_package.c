@@ -3,6 +3,7 @@
 
 void digest();
 int digest_legacy();
+int ktls_sendfile();
 
 int main()
 {
@@ -20,5 +21,12 @@ int main()
 	}
 #endif
 
+#if defined(TEST_OPENSSL_KTLS)
+	if (ktls_sendfile() != 0) {
+		printf("Error testing the ktls_sendfile() function\n");
+		return 1;
+	}
+#endif
+
 	return 0;
 }
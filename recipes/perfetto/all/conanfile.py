@@ -2,7 +2,7 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import copy, get
+from conan.tools.files import copy, get, replace_in_file
 from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
@@ -23,11 +23,13 @@ class PerfettoConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "disable_logging": [True, False], # switches PERFETTO_DISABLE_LOG
+        "shmem_size_hint_kb": [None, "ANY"], # default of TracingInitArgs::shmem_size_hint_kb
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "disable_logging": False,
+        "shmem_size_hint_kb": None,
     }
     short_paths = True
 
@@ -76,6 +78,12 @@ class PerfettoConan(ConanFile):
                 f"{self.ref} requires {compiler} {min_version}. The current compiler is {compiler} {compiler.version}."
             )
 
+        shmem_size_hint_kb = self.options.shmem_size_hint_kb
+        if shmem_size_hint_kb:
+            # The shared memory buffer is made of 4 KiB pages, the service caps it to 32 MiB
+            if not str(shmem_size_hint_kb).isdigit() or not 4 <= int(shmem_size_hint_kb) <= 32768 or int(shmem_size_hint_kb) % 4:
+                raise ConanInvalidConfiguration(f"{self.ref} shmem_size_hint_kb must be a multiple of 4 between 4 and 32768")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -86,7 +94,16 @@ class PerfettoConan(ConanFile):
         tc.variables["PERFETTO_CXX_STANDARD"] = f"cxx_std_{self._minimum_cpp_standard}"
         tc.generate()
 
+    def _patch_sources(self):
+        if self.options.shmem_size_hint_kb:
+            # Changes the default size of the shared memory buffer between the process and the tracing service,
+            # both for the in-process and the system backend. 0 means the service default, 256 KiB.
+            replace_in_file(self, os.path.join(self.source_folder, "sdk", "perfetto.h"),
+                            "uint32_t shmem_size_hint_kb = 0;",
+                            f"uint32_t shmem_size_hint_kb = {self.options.shmem_size_hint_kb};")
+
     def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure(build_script_folder=os.path.join(self.source_folder, os.pardir))
         cmake.build()
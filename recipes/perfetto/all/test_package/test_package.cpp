@@ -1,6 +1,78 @@
 #include <perfetto.h>
 
-int main(int argv, char** argc) {
+#include <cstdint>
+#include <cstdio>
+#include <vector>
+
+PERFETTO_DEFINE_CATEGORIES(
+    perfetto::Category("test_package").SetDescription("Events of the test package"));
+
+PERFETTO_TRACK_EVENT_STATIC_STORAGE();
+
+namespace {
+
+constexpr int kIterations = 1000;
+
+bool read_varint(const uint8_t*& ptr, const uint8_t* end, uint64_t& value) {
+  value = 0;
+  for (int shift = 0; ptr < end && shift < 64; shift += 7) {
+    const uint8_t byte = *ptr++;
+    value |= static_cast<uint64_t>(byte & 0x7f) << shift;
+    if (!(byte & 0x80))
+      return true;
+  }
+  return false;
+}
+
+// Calls on_field(field_id, data, size) for the length-delimited fields of a protobuf message
+template <typename F>
+bool for_each_bytes_field(const uint8_t* ptr, const uint8_t* end, F on_field) {
+  while (ptr < end) {
+    uint64_t tag, value;
+    if (!read_varint(ptr, end, tag))
+      return false;
+    switch (tag & 0x7) {
+      case 0:  // varint
+        if (!read_varint(ptr, end, value))
+          return false;
+        break;
+      case 1:  // fixed64
+        ptr += 8;
+        break;
+      case 2:  // length-delimited
+        if (!read_varint(ptr, end, value) || value > static_cast<uint64_t>(end - ptr))
+          return false;
+        on_field(tag >> 3, ptr, static_cast<size_t>(value));
+        ptr += value;
+        break;
+      case 5:  // fixed32
+        ptr += 4;
+        break;
+      default:
+        return false;
+    }
+  }
+  return ptr == end;
+}
+
+// Counts the packets of a trace (Trace.packet = 1) that hold a track event (TracePacket.track_event = 11)
+int count_track_events(const std::vector<char>& trace) {
+  int count = 0;
+  const uint8_t* begin = reinterpret_cast<const uint8_t*>(trace.data());
+  bool valid = for_each_bytes_field(begin, begin + trace.size(), [&](uint64_t id, const uint8_t* packet, size_t size) {
+    if (id != 1)
+      return;
+    for_each_bytes_field(packet, packet + size, [&](uint64_t packet_field_id, const uint8_t*, size_t) {
+      if (packet_field_id == 11)
+        ++count;
+    });
+  });
+  return valid ? count : -1;
+}
+
+}  // namespace
+
+int main() {
   perfetto::TracingInitArgs args;
 
   // The backends determine where trace events are recorded. You may select one
@@ -16,4 +88,42 @@ int main(int argv, char** argc) {
   args.backends |= perfetto::kSystemBackend;
 
   perfetto::Tracing::Initialize(args);
+  perfetto::TrackEvent::Register();
+
+  perfetto::protos::gen::TrackEventConfig track_event_config;
+  track_event_config.add_enabled_categories("test_package");
+  perfetto::TraceConfig config;
+  config.add_buffers()->set_size_kb(4096);
+  auto* data_source_config = config.add_data_sources()->mutable_config();
+  data_source_config->set_name("track_event");
+  data_source_config->set_track_event_config_raw(track_event_config.SerializeAsString());
+
+  // The daemon might not be running, the trace is recorded in-process
+  auto session = perfetto::Tracing::NewTrace(perfetto::kInProcessBackend);
+  session->Setup(config);
+  session->StartBlocking();
+
+  for (int i = 0; i < kIterations; ++i) {
+    TRACE_EVENT("test_package", "slice", "iteration", i);
+    TRACE_EVENT_INSTANT("test_package", "instant");
+  }
+
+  perfetto::TrackEvent::Flush();
+  session->StopBlocking();
+  std::vector<char> trace(session->ReadTraceBlocking());
+
+  // Each slice is a begin and an end event
+  const int expected = 3 * kIterations;
+  const int recorded = count_track_events(trace);
+  std::printf("trace of %zu bytes, %d track events (expected %d)\n", trace.size(), recorded, expected);
+  if (recorded <= 0)
+    return 1;
+
+#ifdef TEST_DEFAULT_SHMEM_SIZE
+  // The default shared memory buffer holds the whole workload, no event may be lost
+  return recorded == expected ? 0 : 1;
+#else
+  // A small shmem_size_hint_kb makes the producer drop events while the buffer is full
+  return 0;
+#endif
 }
@@ -2,10 +2,10 @@ import glob
 import os
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
-from conan.tools.build import check_min_cppstd
+from conan.errors import ConanException, ConanInvalidConfiguration
+from conan.tools.build import check_min_cppstd, cross_building
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rm, rmdir, replace_in_file
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, rm, rmdir, replace_in_file
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
 
@@ -32,7 +32,10 @@ class RocksDBConan(ConanFile):
         "with_tbb": [True, False],
         "with_folly": [True, False],
         "with_jemalloc": [True, False],
-        "enable_sse": [False, "sse42", "avx2"],
+        "with_liburing": [True, False],
+        "with_numa": [True, False],
+        "isa_level": ["baseline", "x86-64-v2", "x86-64-v3", "x86-64-v4", "native", "armv8-crc"],
+        "enable_sse": [False, "sse42", "avx2", "deprecated"],
         "use_rtti": [True, False],
     }
     default_options = {
@@ -46,7 +49,10 @@ class RocksDBConan(ConanFile):
         "with_tbb": False,
         "with_jemalloc": False,
         "with_folly": False,
-        "enable_sse": False,
+        "with_liburing": False,
+        "with_numa": False,
+        "isa_level": "baseline",
+        "enable_sse": "deprecated",
         "use_rtti": False,
     }
     
@@ -58,12 +64,17 @@ class RocksDBConan(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+            del self.options.with_numa
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.enable_sse != "deprecated":
+            self.output.warning("enable_sse option is deprecated, use isa_level instead.")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -85,6 +96,30 @@ class RocksDBConan(ConanFile):
             self.requires("jemalloc/5.3.0")
         if self.options.with_folly:
             self.requires("folly/2024.08.12.00")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.11")
+        if self.options.get_safe("with_numa"):
+            self.requires("libnuma/2.0.19")
+
+    @property
+    def _enable_sse_isa_levels(self):
+        return {
+            "False": "baseline",
+            "sse42": "x86-64-v2",
+            "avx2": "native",
+        }
+
+    @property
+    def _isa_level(self):
+        # Options can't be modified after configure(), the deprecated enable_sse is mapped here
+        if self.options.enable_sse != "deprecated":
+            return self._enable_sse_isa_levels[str(self.options.enable_sse)]
+        return str(self.options.isa_level)
+
+    def package_id(self):
+        if self.info.options.enable_sse != "deprecated":
+            self.info.options.isa_level = self._enable_sse_isa_levels[str(self.info.options.enable_sse)]
+        del self.info.options.enable_sse
 
     def validate(self):
         check_min_cppstd(self, 17)
@@ -99,6 +134,24 @@ class RocksDBConan(ConanFile):
             # https://github.com/facebook/rocksdb/blob/v10.5.1/CMakeLists.txt#L603
             raise ConanInvalidConfiguration(f"{self.ref} does not support a shared build with folly")
 
+        isa_level = self._isa_level
+        if isa_level.startswith("x86-64-"):
+            if self.settings.arch != "x86_64":
+                raise ConanInvalidConfiguration(f"isa_level={isa_level} requires arch=x86_64")
+            if isa_level == "x86-64-v2" and is_msvc(self):
+                # MSVC has no /arch between the SSE2 baseline and AVX, this would be the baseline build
+                raise ConanInvalidConfiguration("isa_level=x86-64-v2 is not supported with MSVC, use baseline or x86-64-v3")
+            if not self._march_x86_64_levels and not self._force_sse42:
+                minimum_compiler_version = self._march_x86_64_levels_minimum_compiler_version
+                raise ConanInvalidConfiguration(f"isa_level={isa_level} requires {self.settings.compiler} >= {minimum_compiler_version}")
+        elif isa_level == "armv8-crc":
+            if self.settings.arch != "armv8":
+                raise ConanInvalidConfiguration("isa_level=armv8-crc requires arch=armv8")
+            if is_msvc(self):
+                raise ConanInvalidConfiguration("isa_level=armv8-crc is not supported with MSVC")
+        elif isa_level == "native" and cross_building(self):
+            raise ConanInvalidConfiguration("isa_level=native can't be used when cross-building")
+
     def _patch_sources(self):
         # INFO: Avoid enforcing all linkers to use copy-dt-needed-entries
         # https://github.com/facebook/rocksdb/issues/13895
@@ -110,6 +163,37 @@ class RocksDBConan(ConanFile):
         apply_conandata_patches(self)
         self._patch_sources()
 
+    @property
+    def _march_x86_64_levels_minimum_compiler_version(self):
+        return {"gcc": "11", "clang": "12"}.get(str(self.settings.compiler))
+
+    @property
+    def _march_x86_64_levels(self):
+        minimum_compiler_version = self._march_x86_64_levels_minimum_compiler_version
+        return not minimum_compiler_version or Version(self.settings.compiler.version) >= minimum_compiler_version
+
+    @property
+    def _force_sse42(self):
+        # The deprecated enable_sse=sse42 keeps building with compilers which don't know -march=x86-64-v2,
+        # through upstream FORCE_SSE42 (-msse4.2 -mpclmul on top of the portable build)
+        return self.options.enable_sse == "sse42" and not self._march_x86_64_levels
+
+    @property
+    def _portable(self):
+        isa_level = self._isa_level
+        if isa_level == "baseline" or self._force_sse42:
+            return "1"
+        if isa_level == "native":
+            return "0"
+        if is_msvc(self):
+            return {
+                "x86-64-v3": "AVX2",
+                "x86-64-v4": "AVX512",
+            }[isa_level]
+        if isa_level == "armv8-crc":
+            return "armv8-a+crc"
+        return isa_level
+
     def generate(self):
         tc = CMakeToolchain(self)
         tc.variables["FAIL_ON_WARNINGS"] = False
@@ -133,17 +217,13 @@ class RocksDBConan(ConanFile):
         tc.variables["ROCKSDB_LIBRARY_EXPORTS"] = self.settings.os == "Windows" and self.options.shared
         tc.variables["ROCKSDB_DLL" ] = self.settings.os == "Windows" and self.options.shared
         tc.variables["USE_RTTI"] = self.options.use_rtti
-        if not bool(self.options.enable_sse):
-            tc.variables["PORTABLE"] = True
-            tc.variables["FORCE_SSE42"] = False
-        elif self.options.enable_sse == "sse42":
-            tc.variables["PORTABLE"] = True
-            tc.variables["FORCE_SSE42"] = True
-        elif self.options.enable_sse == "avx2":
-            tc.variables["PORTABLE"] = False
-            tc.variables["FORCE_SSE42"] = False
-        # not available yet in CCI
-        tc.variables["WITH_NUMA"] = False
+        # PORTABLE is 1 for the baseline, 0 for -march=native (/arch:AVX2 with MSVC),
+        # otherwise the value given to -march (/arch with MSVC)
+        tc.variables["PORTABLE"] = self._portable
+        tc.variables["FORCE_SSE42"] = self._force_sse42
+        # Always set explicitly, upstream enables WITH_LIBURING by default on Linux and would pick up a system liburing
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
+        tc.variables["WITH_NUMA"] = self.options.get_safe("with_numa", False)
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -154,9 +234,18 @@ class RocksDBConan(ConanFile):
             deps.set_property("zstd", "cmake_target_name", "zstd::zstd")
         if self.options.with_folly:
             deps.set_property("folly", "cmake_additional_variables_prefixes", ["FOLLY",])
+        if self.options.get_safe("with_liburing"):
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
+        if self.options.get_safe("with_numa"):
+            deps.set_property("libnuma", "cmake_file_name", "NUMA")
+            deps.set_property("libnuma", "cmake_target_name", "NUMA::NUMA")
         deps.generate()
 
     def build(self):
+        if self._force_sse42 and "FORCE_SSE42" not in load(self, os.path.join(self.source_folder, "CMakeLists.txt")):
+            # Upstream would silently ignore the variable and build the baseline
+            raise ConanException(f"{self.ref} no longer supports FORCE_SSE42, enable_sse=sse42 requires {self.settings.compiler} >= {self._march_x86_64_levels_minimum_compiler_version}")
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
@@ -205,4 +294,8 @@ class RocksDBConan(ConanFile):
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
         if self.options.with_folly:
-            self.cpp_info.components["librocksdb"].requires.append("folly::folly")
\ No newline at end of file
+            self.cpp_info.components["librocksdb"].requires.append("folly::folly")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
+        if self.options.get_safe("with_numa"):
+            self.cpp_info.components["librocksdb"].requires.append("libnuma::libnuma")
@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import copy, get, rmdir
@@ -22,24 +23,63 @@ class SimdjsonConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "threads": [True, False],
+        "implementations": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threads": True,
+        "implementations": None,
+    }
+    options_description = {
+        "implementations": "Comma-separated list of the kernels to compile (e.g. 'haswell,fallback'), all kernels "
+                           "supported by the architecture when unset. With a single kernel there is no runtime dispatch.",
     }
 
     implements = ["auto_shared_fpic"]
 
+    @property
+    def _available_implementations(self):
+        return {
+            "x86_64": ["icelake", "haswell", "westmere", "fallback"],
+            "armv8": ["arm64", "fallback"],
+            "armv8.3": ["arm64", "fallback"],
+            "ppc64le": ["ppc64", "fallback"],
+            "ppc64": ["ppc64", "fallback"],
+        }.get(str(self.settings.arch), ["fallback"])
+
+    @staticmethod
+    def _normalized_implementations(implementations):
+        # "haswell, fallback", "fallback;haswell" and "haswell,fallback,haswell" build the same library
+        return sorted({impl.strip() for impl in str(implementations).replace(";", ",").split(",") if impl.strip()})
+
+    @property
+    def _excluded_implementations(self):
+        if not self.options.implementations:
+            return []
+        selected = self._normalized_implementations(self.options.implementations)
+        return [impl for impl in self._available_implementations if impl not in selected]
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def package_id(self):
+        if self.info.options.implementations:
+            self.info.options.implementations = ",".join(self._normalized_implementations(self.info.options.implementations))
+
     def validate_build(self):
         check_min_cppstd(self, 17)
 
     def validate(self):
         # https://github.com/simdjson/simdjson/blob/0c0ce1bd48baa0677dc7c0945ea7cd1e8b52b297/CMakeLists.txt#L103
         check_min_cppstd(self, 11)
+        if self.options.implementations:
+            selected = self._normalized_implementations(self.options.implementations)
+            unknown = [impl for impl in selected if impl not in self._available_implementations]
+            if unknown or len(self._excluded_implementations) == len(self._available_implementations):
+                raise ConanInvalidConfiguration(
+                    f"{self.ref} implementations must be taken from {', '.join(self._available_implementations)} "
+                    f"for {self.settings.arch}, got '{self.options.implementations}'")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -48,6 +88,9 @@ class SimdjsonConan(ConanFile):
         tc = CMakeToolchain(self)
         tc.cache_variables["SIMDJSON_ENABLE_THREADS"] = self.options.threads
         tc.cache_variables["SIMDJSON_DEVELOPER_MODE"] = False
+        if self._excluded_implementations:
+            # Kernels enabled for the architecture are kept by default, so only the others need to be excluded
+            tc.cache_variables["SIMDJSON_EXCLUDE_IMPLEMENTATION"] = ";".join(self._excluded_implementations)
 
         cppstd = str(self.settings.compiler.cppstd).replace("gnu", "")
         tc.cache_variables["SIMDJSON_CXX_STANDARD"] = cppstd
@@ -74,8 +117,10 @@ class SimdjsonConan(ConanFile):
         self.cpp_info.libs = ["simdjson"]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs = ["m"]
+        # Part of the public interface: headers must see the same set of kernels as the library
+        self.cpp_info.defines = [f"SIMDJSON_IMPLEMENTATION_{impl.upper()}=0" for impl in self._excluded_implementations]
         if self.options.threads:
-            self.cpp_info.defines = ["SIMDJSON_THREADS_ENABLED=1"]
+            self.cpp_info.defines.append("SIMDJSON_THREADS_ENABLED=1")
             if self.settings.os in ["Linux", "FreeBSD"]:
                 self.cpp_info.system_libs.append("pthread")
         if self.options.shared:
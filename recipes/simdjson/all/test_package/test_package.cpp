@@ -3,6 +3,7 @@
 #include <string>
 
 int main() {
+  std::cout << "simdjson implementation: " << simdjson::get_active_implementation()->name() << std::endl;
   std::string mystring = "{ \"hello\": \"simdjson\" }";
   simdjson::dom::parser parser;
   std::string_view string_value;
@@ -1,8 +1,13 @@
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
-from conan.tools.apple import is_apple_os
+from conan.tools.apple import is_apple_os, XCRun
+from conan.tools.build import cross_building
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import get, load, save
+from conan.tools.env import Environment
+from conan.tools.files import get, load, rm, save
+from conan.tools.microsoft import is_msvc
+from conan.tools.scm import Version
+import glob
 import os
 
 required_conan_version = ">=1.53.0"
@@ -45,9 +50,19 @@ class Sqlite3Conan(ConanFile):
         "max_column": [None, "ANY"],
         "max_variable_number": [None, "ANY"],
         "max_blob_size": [None, "ANY"],
+        "default_memstatus": [True, False],
+        "default_wal_synchronous": [None, 0, 1, 2, 3],
+        "default_cache_size": [None, "ANY"],
+        "default_mmap_size": [None, "ANY"],
+        "max_mmap_size": [None, "ANY"],
+        "default_lookaside": [None, "ANY"],
+        "omit_shared_cache": [True, False],
+        "like_doesnt_match_blobs": [True, False],
         "build_executable": [True, False],
         "enable_default_vfs": [True, False],
         "enable_dbpage_vtab": [True, False],
+        "lto": [True, False],
+        "pgo": [True, False],
     }
     default_options = {
         "shared": False,
@@ -77,12 +92,22 @@ class Sqlite3Conan(ConanFile):
         "max_column": None,             # Uses default value from source
         "max_variable_number": None,    # Uses default value from source
         "max_blob_size": None,          # Uses default value from source
+        "default_memstatus": True,
+        "default_wal_synchronous": None,  # Uses default value from source
+        "default_cache_size": None,     # Uses default value from source
+        "default_mmap_size": None,      # Uses default value from source
+        "max_mmap_size": None,          # Uses default value from source
+        "default_lookaside": None,      # Uses default value from source, "<slot size>,<slot count>"
+        "omit_shared_cache": False,
+        "like_doesnt_match_blobs": False,
         "build_executable": True,
         "enable_default_vfs": True,
         "enable_dbpage_vtab": False,
+        "lto": False,
+        "pgo": False,
     }
 
-    exports_sources = "CMakeLists.txt"
+    exports_sources = "CMakeLists.txt", "pgo_training.sql"
 
     def config_options(self):
         if self.settings.os == "Windows":
@@ -93,6 +118,10 @@ class Sqlite3Conan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if self.options.omit_shared_cache and self.options.enable_unlock_notify:
+            # sqlite3_unlock_notify() only applies to shared-cache connections
+            self.output.warning("omit_shared_cache=True disables enable_unlock_notify")
+            self.options.rm_safe("enable_unlock_notify")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -102,12 +131,18 @@ class Sqlite3Conan(ConanFile):
             self.requires("icu/75.1")
 
     def validate(self):
-        if self.options.build_executable:
+        # The PGO training workload is run through the sqlite3 shell
+        if self.options.build_executable or self.options.pgo:
+            shell_option = "build_executable=True" if self.options.build_executable else "pgo=True"
             if not self.options.enable_default_vfs:
                 # Need to provide custom VFS code: https://www.sqlite.org/custombuild.html
-                raise ConanInvalidConfiguration("build_executable=True cannot be combined with enable_default_vfs=False")
+                raise ConanInvalidConfiguration(f"{shell_option} cannot be combined with enable_default_vfs=False")
             if self.options.omit_load_extension:
-                raise ConanInvalidConfiguration("build_executable=True requires omit_load_extension=True")
+                raise ConanInvalidConfiguration(f"{shell_option} cannot be combined with omit_load_extension=True")
+
+    def validate_build(self):
+        if self.options.pgo:
+            self._pgo_validate_build()
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -116,7 +151,7 @@ class Sqlite3Conan(ConanFile):
         tc = CMakeToolchain(self)
         tc.variables["SQLITE3_SRC_DIR"] = self.source_folder.replace("\\", "/")
         tc.variables["SQLITE3_VERSION"] = self.version
-        tc.variables["SQLITE3_BUILD_EXECUTABLE"] = self.options.build_executable
+        tc.variables["SQLITE3_BUILD_EXECUTABLE"] = self.options.build_executable or self.options.pgo
         tc.variables["THREADSAFE"] = self.options.threadsafe
         tc.variables["ENABLE_COLUMN_METADATA"] = self.options.enable_column_metadata
         tc.variables["ENABLE_DBSTAT_VTAB"] = self.options.enable_dbstat_vtab
@@ -131,7 +166,7 @@ class Sqlite3Conan(ConanFile):
         tc.variables["ENABLE_PREUPDATE_HOOK"] = self.options.enable_preupdate_hook
         tc.variables["ENABLE_SOUNDEX"] = self.options.enable_soundex
         tc.variables["ENABLE_RTREE"] = self.options.enable_rtree
-        tc.variables["ENABLE_UNLOCK_NOTIFY"] = self.options.enable_unlock_notify
+        tc.variables["ENABLE_UNLOCK_NOTIFY"] = self.options.get_safe("enable_unlock_notify", False)
         tc.variables["ENABLE_DEFAULT_SECURE_DELETE"] = self.options.enable_default_secure_delete
         tc.variables["USE_ALLOCA"] = self.options.use_alloca
         tc.variables["USE_URI"] = self.options.use_uri
@@ -151,13 +186,101 @@ class Sqlite3Conan(ConanFile):
             tc.variables["MAX_VARIABLE_NUMBER"] = self.options.max_variable_number
         if self.options.max_blob_size:
             tc.variables["MAX_BLOB_SIZE"] = self.options.max_blob_size
+        tc.variables["DEFAULT_MEMSTATUS"] = self.options.default_memstatus
+        if self.options.default_wal_synchronous != None:  # 0 (OFF) is a valid value, can't test truthiness
+            tc.variables["DEFAULT_WAL_SYNCHRONOUS"] = self.options.default_wal_synchronous
+        if self.options.default_cache_size != None:  # 0 is a valid value
+            tc.variables["DEFAULT_CACHE_SIZE"] = self.options.default_cache_size
+        if self.options.default_mmap_size != None:
+            tc.variables["DEFAULT_MMAP_SIZE"] = self.options.default_mmap_size
+        if self.options.max_mmap_size != None:
+            tc.variables["MAX_MMAP_SIZE"] = self.options.max_mmap_size
+        if self.options.default_lookaside:
+            tc.variables["DEFAULT_LOOKASIDE"] = self.options.default_lookaside
+        tc.variables["OMIT_SHARED_CACHE"] = self.options.omit_shared_cache
+        tc.variables["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
         tc.variables["DISABLE_DEFAULT_VFS"] = not self.options.enable_default_vfs
         tc.variables["ENABLE_DBPAGE_VTAB"] = self.options.enable_dbpage_vtab
+        if self.options.lto:
+            if self.settings.compiler == "gcc" and not self.options.shared:
+                # A static sqlite3 built with CMake IPO on gcc would only contain GIMPLE, embed regular code as well
+                tc.extra_cflags.extend(["-flto", "-ffat-lto-objects"])
+            else:
+                tc.cache_variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
         tc.generate()
 
+    @property
+    def _pgo_profile_dir(self):
+        # A profile found in this folder is reused and the training step is skipped
+        return self.conf.get("user.sqlite3:pgo_profile_dir", check_type=str) or os.path.join(self.build_folder, "pgo")
+
+    def _pgo_validate_build(self):
+        if is_msvc(self):
+            raise ConanInvalidConfiguration(f"{self.ref} pgo=True is not supported with msvc")
+        reused_profile = self.conf.get("user.sqlite3:pgo_profile_dir", check_type=str)
+        if cross_building(self) and not reused_profile:
+            raise ConanInvalidConfiguration(f"{self.ref} pgo=True can't run the training workload when cross-building, "
+                                            "provide a profile with user.sqlite3:pgo_profile_dir")
+        if reused_profile and self.settings.compiler == "gcc" and Version(self.settings.compiler.version) < "11":
+            # gcc names the profile files after the object paths, only -fprofile-prefix-path makes them independent of the build folder
+            raise ConanInvalidConfiguration(f"{self.ref} reusing a PGO profile (user.sqlite3:pgo_profile_dir) requires gcc >= 11")
+
+    def _pgo_has_profile(self):
+        if self.settings.compiler == "gcc":
+            return bool(glob.glob(os.path.join(self._pgo_profile_dir, "*.gcda")))
+        return os.path.isfile(os.path.join(self._pgo_profile_dir, "default.profdata"))
+
+    def _pgo_env(self, phase):
+        # CFLAGS and LDFLAGS of the "generate" (instrumented) or "use" phase
+        if self.settings.compiler == "gcc":
+            flags = [f"-fprofile-{phase}={self._pgo_profile_dir}"]
+            if phase == "generate":
+                flags.append("-fprofile-update=prefer-atomic")
+            else:
+                flags.append("-fprofile-correction")
+            if Version(self.settings.compiler.version) >= "11":
+                # Makes the profile file names independent of the build folder, so that the profile can be cached
+                flags.append(f"-fprofile-prefix-path={self.build_folder}")
+        elif phase == "generate":
+            flags = [f"-fprofile-generate={self._pgo_profile_dir}"]
+        else:
+            flags = [f"-fprofile-use={os.path.join(self._pgo_profile_dir, 'default.profdata')}"]
+        env = Environment()
+        env.append("CFLAGS", flags)
+        env.append("LDFLAGS", flags)
+        return env
+
+    def _pgo_merge_profiles(self):
+        # clang writes raw profiles which must be merged, gcc uses them as they are
+        if self.settings.compiler not in ["clang", "apple-clang"]:
+            return
+        profdata = XCRun(self).find("llvm-profdata") if is_apple_os(self) else "llvm-profdata"
+        raw_profiles = " ".join(f'"{f}"' for f in glob.glob(os.path.join(self._pgo_profile_dir, "*.profraw")))
+        self.run(f"{profdata} merge -output=\"{os.path.join(self._pgo_profile_dir, 'default.profdata')}\" {raw_profiles}")
+
+    def _pgo_train(self):
+        cmake = CMake(self)
+        with self._pgo_env("generate").vars(self).apply():
+            cmake.configure(build_script_folder=os.path.join(self.source_folder, os.pardir))
+        cmake.build()
+        shell = os.path.join(self.build_folder, "sqlite3")
+        training_db = os.path.join(self.build_folder, "pgo_training.db")
+        training_sql = os.path.join(self.source_folder, os.pardir, "pgo_training.sql").replace("\\", "/")
+        rm(self, "pgo_training.db*", self.build_folder)
+        self.run(f"\"{shell}\" \"{training_db}\" \".read {training_sql}\"", env="conanrun")
+        self._pgo_merge_profiles()
+        # Next configure must pick up the new flags
+        rm(self, "CMakeCache.txt", self.build_folder)
+
     def build(self):
+        env = Environment()
+        if self.options.pgo:
+            if not self._pgo_has_profile():
+                self._pgo_train()
+            env = self._pgo_env("use")
         cmake = CMake(self)
-        cmake.configure(build_script_folder=os.path.join(self.source_folder, os.pardir))
+        with env.vars(self).apply():
+            cmake.configure(build_script_folder=os.path.join(self.source_folder, os.pardir))
         cmake.build()
 
     def _extract_license(self):
@@ -169,6 +292,10 @@ class Sqlite3Conan(ConanFile):
         save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
         cmake = CMake(self)
         cmake.install()
+        if self.options.pgo and not self.options.build_executable:
+            # The shell was only built to run the PGO training workload
+            rm(self, "sqlite3", os.path.join(self.package_folder, "bin"))
+            rm(self, "sqlite3.exe", os.path.join(self.package_folder, "bin"))
 
     def package_info(self):
         self.cpp_info.set_property("cmake_find_mode", "both")
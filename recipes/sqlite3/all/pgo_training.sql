@@ -0,0 +1,51 @@
+-- Training workload for the pgo option, loosely modeled on the speedtest1 test cases
+PRAGMA journal_mode = WAL;
+PRAGMA cache_size = -8192;
+
+CREATE TABLE t1(a INTEGER, b INTEGER, c TEXT);
+CREATE TABLE t2(a INTEGER PRIMARY KEY, b INTEGER, c TEXT);
+CREATE TABLE t3(a INTEGER, b INTEGER, c TEXT);
+
+-- Inserts into unindexed, rowid and indexed tables
+BEGIN;
+WITH RECURSIVE cnt(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM cnt WHERE x < 100000)
+INSERT INTO t1 SELECT x, abs(random() % 100000), printf('row %d of the first table', x) FROM cnt;
+WITH RECURSIVE cnt(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM cnt WHERE x < 100000)
+INSERT INTO t2 SELECT x, abs(random() % 100000), printf('%08d %s', x, hex(randomblob(16))) FROM cnt;
+COMMIT;
+
+CREATE INDEX t3b ON t3(b);
+BEGIN;
+INSERT INTO t3 SELECT a, b, c FROM t1;
+COMMIT;
+
+-- Range scans and aggregates without an index
+SELECT count(*), avg(b), sum(length(c)) FROM t1 WHERE b BETWEEN 1000 AND 51000;
+SELECT count(*) FROM t1 WHERE c LIKE '%of the first%';
+SELECT b % 100 AS k, count(*), max(a) FROM t1 GROUP BY k ORDER BY k LIMIT 10;
+
+-- Indexed lookups and joins
+CREATE INDEX t1b ON t1(b);
+CREATE INDEX t2c ON t2(c);
+SELECT count(*), avg(t2.b) FROM t1 JOIN t2 ON t1.a = t2.a WHERE t1.b < 20000;
+SELECT count(*) FROM t2 WHERE c BETWEEN '00010000' AND '00020000';
+SELECT t3.a, t1.c FROM t3 JOIN t1 ON t1.b = t3.b WHERE t3.b BETWEEN 500 AND 520 ORDER BY t3.a;
+
+-- Updates and deletes
+BEGIN;
+UPDATE t1 SET b = b * 2 WHERE a % 7 = 0;
+UPDATE t2 SET c = upper(c) WHERE a BETWEEN 20000 AND 40000;
+DELETE FROM t3 WHERE b % 3 = 0;
+REPLACE INTO t2 SELECT a, b, c FROM t1 WHERE a % 11 = 0;
+COMMIT;
+
+-- Sorting and subqueries
+SELECT c FROM t2 ORDER BY c DESC LIMIT 5;
+SELECT count(*) FROM t1 WHERE b IN (SELECT b FROM t3 WHERE a < 10000);
+SELECT DISTINCT substr(c, 1, 4) FROM t2 LIMIT 20;
+
+PRAGMA integrity_check;
+VACUUM;
+DROP TABLE t3;
+DROP TABLE t2;
+DROP TABLE t1;
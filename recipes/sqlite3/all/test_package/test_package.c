@@ -1,7 +1,104 @@
 #include <stdio.h>
+#include <time.h>
 #include <sqlite3.h>
 
+#ifdef TEST_DEFAULT_VFS
+#define ROWS 100000
+
+static int exec(sqlite3 *db, const char *sql) {
+    char *error = NULL;
+    if (sqlite3_exec(db, sql, NULL, NULL, &error) != SQLITE_OK) {
+        printf("%s: %s\n", sql, error);
+        sqlite3_free(error);
+        return 1;
+    }
+    return 0;
+}
+
+static void report(const char *step, clock_t start) {
+    double seconds = (double)(clock() - start) / CLOCKS_PER_SEC;
+    printf("%s: %d rows in %.3f s", step, ROWS, seconds);
+    if (seconds > 0) {
+        printf(" (%.0f rows/s)", ROWS / seconds);
+    }
+    printf("\n");
+}
+
+// Short speedtest1-style workload: bulk insert, indexed point lookups and a full scan
+static int speedtest(void) {
+    const char *path = "test_package.db";
+    sqlite3 *db = NULL;
+    sqlite3_stmt *stmt = NULL;
+    clock_t start;
+    int ret = 1;
+
+    remove(path);
+    if (sqlite3_open(path, &db) != SQLITE_OK) {
+        printf("sqlite3_open: %s\n", sqlite3_errmsg(db));
+        goto end;
+    }
+    if (exec(db, "PRAGMA journal_mode=WAL") || exec(db, "CREATE TABLE t1(a INTEGER PRIMARY KEY, b INTEGER, c TEXT)")) {
+        goto end;
+    }
+
+    start = clock();
+    exec(db, "BEGIN");
+    sqlite3_prepare_v2(db, "INSERT INTO t1 VALUES(?1, ?2, printf('row %d', ?1))", -1, &stmt, NULL);
+    for (int i = 1; i <= ROWS; i++) {
+        sqlite3_bind_int(stmt, 1, i);
+        sqlite3_bind_int(stmt, 2, (i * 7919) % ROWS);
+        if (sqlite3_step(stmt) != SQLITE_DONE) {
+            printf("insert: %s\n", sqlite3_errmsg(db));
+            goto end;
+        }
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    stmt = NULL;
+    if (exec(db, "COMMIT")) {
+        goto end;
+    }
+    report("insert", start);
+
+    start = clock();
+    sqlite3_prepare_v2(db, "SELECT b FROM t1 WHERE a = ?1", -1, &stmt, NULL);
+    for (int i = 1; i <= ROWS; i++) {
+        sqlite3_bind_int(stmt, 1, (i * 31) % ROWS + 1);
+        if (sqlite3_step(stmt) != SQLITE_ROW) {
+            printf("lookup: %s\n", sqlite3_errmsg(db));
+            goto end;
+        }
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    stmt = NULL;
+    report("lookup", start);
+
+    start = clock();
+    sqlite3_prepare_v2(db, "SELECT count(*), sum(length(c)) FROM t1 WHERE c LIKE 'row %'", -1, &stmt, NULL);
+    if (sqlite3_step(stmt) != SQLITE_ROW || sqlite3_column_int(stmt, 0) != ROWS) {
+        printf("scan: unexpected result\n");
+        goto end;
+    }
+    report("scan", start);
+    ret = 0;
+
+end:
+    sqlite3_finalize(stmt);
+    sqlite3_close(db);
+    remove(path);
+    remove("test_package.db-wal");
+    remove("test_package.db-shm");
+    return ret;
+}
+#endif
+
 int main() {
     printf("SQLite Version: %s\n", sqlite3_libversion());
+#ifdef TEST_DEFAULT_VFS
+    return speedtest();
+#else
+    // Without the default VFS there is no way to open a database file
     return 0;
+#endif
 }
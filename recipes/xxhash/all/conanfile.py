@@ -20,11 +20,13 @@ class XxHashConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "utility": [True, False],
+        "dispatch": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "utility": True,
+        "dispatch": False,
     }
 
     def export_sources(self):
@@ -33,6 +35,9 @@ class XxHashConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # The upstream CMake only builds xxh_x86dispatch.c for x86_64, since 0.8.2
+        if self.settings.arch != "x86_64" or Version(self.version) < "0.8.2":
+            del self.options.dispatch
 
     def configure(self):
         if self.options.shared:
@@ -50,6 +55,8 @@ class XxHashConan(ConanFile):
         tc = CMakeToolchain(self)
         tc.variables["XXHASH_BUNDLED_MODE"] = False
         tc.variables["XXHASH_BUILD_XXHSUM"] = self.options.utility
+        if self.options.get_safe("dispatch"):
+            tc.variables["DISPATCH"] = True
         # Fix CMake configuration if target is iOS/tvOS/watchOS
         tc.cache_variables["CMAKE_MACOSX_BUNDLE"] = False
         # Generate a relocatable shared lib on Macos
@@ -68,6 +75,8 @@ class XxHashConan(ConanFile):
         copy(self, "LICENSE", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
         cmake = CMake(self)
         cmake.install()
+        if self.options.get_safe("dispatch"):
+            copy(self, "xxh_x86dispatch.h", src=self.source_folder, dst=os.path.join(self.package_folder, "include"))
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
@@ -79,3 +88,10 @@ class XxHashConan(ConanFile):
         # TODO: back to global scope in conan v2 once cmake_find_package_* generators removed
         self.cpp_info.components["libxxhash"].libs = ["xxhash"]
         self.cpp_info.components["libxxhash"].set_property("cmake_target_name", "xxHash::xxhash")
+
+        if self.options.get_safe("dispatch"):
+            # The dispatcher is built into libxxhash, including xxh_x86dispatch.h redirects the XXH3 functions to it
+            self.cpp_info.components["dispatch"].set_property("cmake_target_name", "xxHash::dispatch")
+            self.cpp_info.components["dispatch"].requires = ["libxxhash"]
+            self.cpp_info.components["dispatch"].libdirs = []
+            self.cpp_info.components["dispatch"].bindirs = []
@@ -1,8 +1,37 @@
 #include "xxhash.h"
+#ifdef TEST_XXH_DISPATCH
+// Call the dispatcher explicitly, to compare it with the baseline implementation
+#define XXH_DISPATCH_DISABLE_REPLACE
+#include "xxh_x86dispatch.h"
+#endif
 
 #include <stdio.h>
 #include <stdlib.h>
 
+#ifdef TEST_XXH_DISPATCH
+static int test_dispatch(void)
+{
+    // Large enough to go through the vectorized accumulate loop of whichever kernel gets dispatched
+    size_t const bufferSize = 1 << 20;
+    unsigned char* const buffer = malloc(bufferSize);
+    XXH64_hash_t baseline, dispatched;
+
+    if (buffer == NULL)
+        return 1;
+    for (size_t i = 0; i < bufferSize; i++)
+        buffer[i] = (unsigned char)(i * 2654435761u >> 13);
+
+    baseline = XXH3_64bits(buffer, bufferSize);
+    dispatched = XXH3_64bits_dispatch(buffer, bufferSize);
+    free(buffer);
+
+    if (baseline != dispatched) {
+        printf("XXH3 dispatch: hash mismatch %llu != %llu\n", (unsigned long long)baseline, (unsigned long long)dispatched);
+        return 1;
+    }
+    return 0;
+}
+#endif
 
 int main()
 {
@@ -11,5 +40,10 @@ int main()
     XXH64_hash_t hash = XXH64(buffer, bufferSize, 0);
     printf("%llu", hash);
     free(buffer);
+#ifdef TEST_XXH_DISPATCH
+    printf("\n");
+    return test_dispatch();
+#else
     return 0;
+#endif
 }
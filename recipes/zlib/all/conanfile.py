@@ -21,10 +21,12 @@ class ZlibConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "lto": False,
     }
 
     def export_sources(self):
@@ -57,6 +59,13 @@ class ZlibConan(ConanFile):
         tc.variables["INSTALL_LIB_DIR"] = "lib"
         tc.variables["INSTALL_INC_DIR"] = "include"
         tc.variables["ZLIB_BUILD_EXAMPLES"] = False
+        if self.options.lto:
+            if self.settings.compiler == "gcc" and not self.options.shared:
+                # CMake IPO compiles with -fno-fat-lto-objects on gcc, the static zlib would then only link with -flto
+                tc.extra_cflags.extend(["-flto", "-ffat-lto-objects"])
+            else:
+                tc.cache_variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
+                tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
         tc.generate()
 
     def _patch_sources(self):
@@ -1,6 +1,11 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.apple import is_apple_os, XCRun
+from conan.tools.build import cross_building
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.env import Environment
 from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rmdir, rm
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import glob
 import os
@@ -22,12 +27,36 @@ class ZstdConan(ConanFile):
         "fPIC": [True, False],
         "threading": [True, False],
         "build_programs": [True, False],
+        "lto": [True, False],
+        "pgo": [True, False],
+        "legacy_support": [None, 0, 1, 2, 3, 4, 5, 6, 7],
+        "with_asm": [True, False],
+        "huf_force_decompress": [None, "x1", "x2"],
+        "minify": [True, False],
+        "build_compression": [True, False],
+        "build_decompression": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threading": True,
         "build_programs": True,
+        "lto": False,
+        "pgo": False,
+        "legacy_support": None,
+        "with_asm": True,
+        "huf_force_decompress": None,
+        "minify": False,
+        "build_compression": True,
+        "build_decompression": True,
+    }
+    options_description = {
+        "legacy_support": "Decode frames of the legacy formats starting from v0.N, 0 disables legacy support (None keeps upstream default)",
+        "with_asm": "Use the x86_64 BMI2 assembly Huffman decoder",
+        "huf_force_decompress": "Only build one of the two Huffman decoders (x1 is smaller, x2 is faster on large inputs)",
+        "minify": "Strip error strings, inlining, legacy support and the x2 Huffman decoder to minimize the library size",
+        "build_compression": "Build the compression part of the library",
+        "build_decompression": "Build the decompression part of the library",
     }
 
     def export_sources(self):
@@ -36,6 +65,12 @@ class ZstdConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch != "x86_64":
+            del self.options.with_asm
+        if Version(self.version) < "1.5.5":
+            # ZSTD_BUILD_COMPRESSION and ZSTD_BUILD_DECOMPRESSION are not available
+            del self.options.build_compression
+            del self.options.build_decompression
 
     def configure(self):
         if self.options.shared:
@@ -46,15 +81,72 @@ class ZstdConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    @property
+    def _build_compression(self):
+        return self.options.get_safe("build_compression", True)
+
+    @property
+    def _build_decompression(self):
+        return self.options.get_safe("build_decompression", True)
+
+    def validate(self):
+        if not self._build_compression and not self._build_decompression:
+            raise ConanInvalidConfiguration(f"{self.ref} requires at least one of build_compression or build_decompression")
+        if self.options.minify:
+            if self.options.legacy_support != None and self.options.legacy_support != 0:
+                raise ConanInvalidConfiguration(f"{self.ref} minify=True disables legacy support, legacy_support must be left unset")
+            if self.options.huf_force_decompress == "x2":
+                raise ConanInvalidConfiguration(f"{self.ref} minify=True only keeps the x1 Huffman decoder, huf_force_decompress=x2 is not possible")
+
+    def validate_build(self):
+        if (self.options.build_programs or self.options.pgo) and not (self._build_compression and self._build_decompression):
+            raise ConanInvalidConfiguration(f"{self.ref} programs (build_programs or pgo) require build_compression and build_decompression")
+        if self.options.pgo:
+            self._pgo_validate_build()
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["ZSTD_BUILD_PROGRAMS"] = self.options.build_programs
-        tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
+        # The PGO training workload runs the zstd program
+        build_programs = self.options.build_programs or self.options.pgo
+        # With gcc the profile is keyed by object file, it must be collected on the objects of the packaged library
+        programs_link_shared = self.options.shared and self.options.pgo
+        tc.variables["ZSTD_BUILD_PROGRAMS"] = build_programs
+        tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or (build_programs and not programs_link_shared)
+        tc.variables["ZSTD_PROGRAMS_LINK_SHARED"] = programs_link_shared
         tc.variables["ZSTD_BUILD_SHARED"] = self.options.shared
         tc.variables["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        if self.options.lto:
+            if self.settings.compiler == "gcc" and not self.options.shared:
+                # Not CMake IPO: with gcc it emits slim LTO objects, which consumers of the static library can't link without -flto
+                tc.extra_cflags.extend(["-flto", "-ffat-lto-objects"])
+            else:
+                tc.cache_variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
+                tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+        if self.options.minify:
+            # Same as ZSTD_LIB_MINIFY of the upstream Makefile, which has no CMake equivalent
+            tc.variables["ZSTD_LEGACY_SUPPORT"] = False
+            tc.preprocessor_definitions["ZSTD_NO_INLINE"] = 1
+            tc.preprocessor_definitions["ZSTD_STRIP_ERROR_STRINGS"] = 1
+            tc.preprocessor_definitions["HUF_FORCE_DECOMPRESS_X1"] = 1
+            tc.preprocessor_definitions["ZSTD_FORCE_DECOMPRESS_SEQUENCES_SHORT"] = 1
+        elif self.options.legacy_support != None:
+            tc.variables["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_support != 0
+            if self.options.legacy_support != 0:
+                tc.cache_variables["ZSTD_LEGACY_LEVEL"] = str(self.options.legacy_support)
+        if self.options.huf_force_decompress == "x1":
+            tc.preprocessor_definitions["HUF_FORCE_DECOMPRESS_X1"] = 1
+        elif self.options.huf_force_decompress == "x2":
+            tc.preprocessor_definitions["HUF_FORCE_DECOMPRESS_X2"] = 1
+        if not self.options.get_safe("with_asm", True):
+            tc.preprocessor_definitions["ZSTD_DISABLE_ASM"] = 1
+        if Version(self.version) >= "1.5.5":
+            tc.variables["ZSTD_BUILD_COMPRESSION"] = self._build_compression
+            tc.variables["ZSTD_BUILD_DECOMPRESSION"] = self._build_decompression
+            # The dictionary builder depends on the compressor, the zstd program needs it for --train
+            tc.variables["ZSTD_BUILD_DICTBUILDER"] = bool(self._build_compression and (build_programs or not self.options.minify))
         if Version(self.version) < "1.5.6":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
@@ -65,10 +157,80 @@ class ZstdConan(ConanFile):
         replace_in_file(self, os.path.join(self.source_folder, "build", "cmake", "lib", "CMakeLists.txt"),
                               "POSITION_INDEPENDENT_CODE On", "")
 
+    @property
+    def _cmakelists_folder(self):
+        return os.path.join(self.source_folder, "build", "cmake")
+
+    @property
+    def _pgo_profile_dir(self):
+        # A profile found in this folder is reused and the training step is skipped
+        return self.conf.get("user.zstd:pgo_profile_dir", check_type=str) or os.path.join(self.build_folder, "pgo")
+
+    def _pgo_validate_build(self):
+        if is_msvc(self):
+            raise ConanInvalidConfiguration(f"{self.ref} pgo=True is not supported with msvc")
+        reused_profile = self.conf.get("user.zstd:pgo_profile_dir", check_type=str)
+        if cross_building(self) and not reused_profile:
+            raise ConanInvalidConfiguration(f"{self.ref} pgo=True can't run the training workload when cross-building, "
+                                            "provide a profile with user.zstd:pgo_profile_dir")
+        if reused_profile and self.settings.compiler == "gcc" and Version(self.settings.compiler.version) < "11":
+            # gcc names the profile files after the object paths, only -fprofile-prefix-path makes them independent of the build folder
+            raise ConanInvalidConfiguration(f"{self.ref} reusing a PGO profile (user.zstd:pgo_profile_dir) requires gcc >= 11")
+
+    def _pgo_has_profile(self):
+        if self.settings.compiler == "gcc":
+            return bool(glob.glob(os.path.join(self._pgo_profile_dir, "*.gcda")))
+        return os.path.isfile(os.path.join(self._pgo_profile_dir, "default.profdata"))
+
+    def _pgo_env(self, phase):
+        # CFLAGS and LDFLAGS of the "generate" (instrumented) or "use" phase
+        if self.settings.compiler == "gcc":
+            flags = [f"-fprofile-{phase}={self._pgo_profile_dir}"]
+            if phase == "generate":
+                flags.append("-fprofile-update=prefer-atomic")
+            else:
+                flags.append("-fprofile-correction")
+            if Version(self.settings.compiler.version) >= "11":
+                # Makes the profile file names independent of the build folder, so that the profile can be cached
+                flags.append(f"-fprofile-prefix-path={self.build_folder}")
+        elif phase == "generate":
+            flags = [f"-fprofile-generate={self._pgo_profile_dir}"]
+        else:
+            flags = [f"-fprofile-use={os.path.join(self._pgo_profile_dir, 'default.profdata')}"]
+        env = Environment()
+        env.append("CFLAGS", flags)
+        env.append("LDFLAGS", flags)
+        return env
+
+    def _pgo_merge_profiles(self):
+        # clang writes raw profiles which must be merged, gcc uses them as they are
+        if self.settings.compiler not in ["clang", "apple-clang"]:
+            return
+        profdata = XCRun(self).find("llvm-profdata") if is_apple_os(self) else "llvm-profdata"
+        raw_profiles = " ".join(f'"{f}"' for f in glob.glob(os.path.join(self._pgo_profile_dir, "*.profraw")))
+        self.run(f"{profdata} merge -output=\"{os.path.join(self._pgo_profile_dir, 'default.profdata')}\" {raw_profiles}")
+
+    def _pgo_train(self):
+        cmake = CMake(self)
+        with self._pgo_env("generate").vars(self).apply():
+            cmake.configure(build_script_folder=self._cmakelists_folder)
+        cmake.build()
+        # Benchmark mode compresses and decompresses a generated sample at levels 1 to 9
+        self.run(f"\"{os.path.join(self.build_folder, 'programs', 'zstd')}\" -b1e9 -i1")
+        self._pgo_merge_profiles()
+        # Next configure must pick up the new flags
+        rm(self, "CMakeCache.txt", self.build_folder)
+
     def build(self):
         self._patch_sources()
+        env = Environment()
+        if self.options.pgo:
+            if not self._pgo_has_profile():
+                self._pgo_train()
+            env = self._pgo_env("use")
         cmake = CMake(self)
-        cmake.configure(build_script_folder=os.path.join(self.source_folder, "build", "cmake"))
+        with env.vars(self).apply():
+            cmake.configure(build_script_folder=self._cmakelists_folder)
         cmake.build()
 
     def package(self):
@@ -78,8 +240,13 @@ class ZstdConan(ConanFile):
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
+        if self.options.pgo and not self.options.build_programs:
+            # Programs were only built to run the PGO training workload
+            for program in ("zstd", "zstdcat", "unzstd", "zstdmt", "zstdgrep", "zstdless"):
+                rm(self, program, os.path.join(self.package_folder, "bin"))
+                rm(self, f"{program}.exe", os.path.join(self.package_folder, "bin"))
 
-        if self.options.shared and self.options.build_programs:
+        if self.options.shared and (self.options.build_programs or self.options.pgo):
             # If we build programs we have to build static libs (see logic in generate()),
             # but if shared is True, we only want shared lib in package folder.
             rm(self, "*_static.*", os.path.join(self.package_folder, "lib"))
@@ -1,12 +1,117 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <time.h>
 #include <zstd.h>
 
+#define CORPUS_SIZE (16 * 1024 * 1024)
+#define COMPRESSION_LEVEL 3
+
+#if defined(TEST_ZSTD_COMPRESSION) && defined(TEST_ZSTD_DECOMPRESSION)
+static double now(void) {
+    return (double)clock() / CLOCKS_PER_SEC;
+}
+
+static double megabytes_per_second(size_t size, double seconds) {
+    return seconds > 0 ? (double)size / (1024.0 * 1024.0) / seconds : 0.0;
+}
+
+// Text made of words picked by a pseudo-random generator, which compresses roughly like natural language
+static void generate_corpus(char *corpus, size_t size) {
+    static const char *words[] = {
+        "the", "of", "compression", "and", "zstandard", "dictionary", "frame", "block", "entropy", "huffman",
+        "sequence", "literal", "match", "offset", "window", "level", "stream", "buffer", "decoder", "encoder",
+    };
+    unsigned int state = 2463534242u;
+    size_t pos = 0;
+    while (pos < size) {
+        const char *word;
+        size_t len;
+        state ^= state << 13;
+        state ^= state >> 17;
+        state ^= state << 5;
+        word = words[state % (sizeof(words) / sizeof(words[0]))];
+        len = strlen(word);
+        if (pos + len + 1 > size)
+            break;
+        memcpy(corpus + pos, word, len);
+        pos += len;
+        corpus[pos++] = (state & 0xF00) == 0 ? '\n' : ' ';
+    }
+    memset(corpus + pos, ' ', size - pos);
+}
+
+static int benchmark(void) {
+    int ret = 1;
+    size_t compressed_bound = ZSTD_compressBound(CORPUS_SIZE);
+    size_t compressed_size, decompressed_size;
+    double start, compress_time, decompress_time;
+    char *corpus = malloc(CORPUS_SIZE);
+    char *compressed = malloc(compressed_bound);
+    char *decompressed = malloc(CORPUS_SIZE);
+
+    if (corpus == NULL || compressed == NULL || decompressed == NULL) {
+        printf("failed to allocate the benchmark buffers\n");
+        goto end;
+    }
+    generate_corpus(corpus, CORPUS_SIZE);
+
+    start = now();
+    compressed_size = ZSTD_compress(compressed, compressed_bound, corpus, CORPUS_SIZE, COMPRESSION_LEVEL);
+    compress_time = now() - start;
+    if (ZSTD_isError(compressed_size)) {
+        printf("compression failed: %s\n", ZSTD_getErrorName(compressed_size));
+        goto end;
+    }
+
+    start = now();
+    decompressed_size = ZSTD_decompress(decompressed, CORPUS_SIZE, compressed, compressed_size);
+    decompress_time = now() - start;
+    if (ZSTD_isError(decompressed_size)) {
+        printf("decompression failed: %s\n", ZSTD_getErrorName(decompressed_size));
+        goto end;
+    }
+    if (decompressed_size != CORPUS_SIZE || memcmp(corpus, decompressed, CORPUS_SIZE) != 0) {
+        printf("decompressed data doesn't match the corpus\n");
+        goto end;
+    }
+
+    printf("level %d: %d bytes -> %zu bytes (ratio %.2f)\n", COMPRESSION_LEVEL, CORPUS_SIZE, compressed_size,
+           (double)CORPUS_SIZE / (double)compressed_size);
+    printf("compression:   %.1f MB/s\n", megabytes_per_second(CORPUS_SIZE, compress_time));
+    printf("decompression: %.1f MB/s\n", megabytes_per_second(CORPUS_SIZE, decompress_time));
+    ret = 0;
+
+end:
+    free(corpus);
+    free(compressed);
+    free(decompressed);
+    return ret;
+}
+#endif
+
 int main() {
-    const char* originalData = "Sample text";
-    size_t compressedSize = ZSTD_compressBound(strlen(originalData) + 1);
-    printf("%zu\n", compressedSize);
+    printf("zstd %s\n", ZSTD_versionString());
 
+#if defined(TEST_ZSTD_COMPRESSION) && defined(TEST_ZSTD_DECOMPRESSION)
+    return benchmark();
+#elif defined(TEST_ZSTD_COMPRESSION)
+    {
+        ZSTD_CCtx *cctx = ZSTD_createCCtx();
+        if (cctx == NULL)
+            return 1;
+        printf("compression only library, skipping the benchmark\n");
+        ZSTD_freeCCtx(cctx);
+    }
+    return 0;
+#else
+    {
+        ZSTD_DCtx *dctx = ZSTD_createDCtx();
+        if (dctx == NULL)
+            return 1;
+        printf("decompression only library, skipping the benchmark\n");
+        ZSTD_freeDCtx(dctx);
+    }
     return 0;
+#endif
 }